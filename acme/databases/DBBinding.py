@@ -374,6 +374,20 @@ class DBBinding(ABC):
 		...
 
 
+	@abstractmethod
+	def drainBatchNotifications(self, ri:str, nu:str) -> list[JSON]:
+		"""	Return and remove the batch notifications for a resource and notification URI in a single operation.
+
+			Args:
+				ri: The resource ID of the resource.
+				nu: The notification URI.
+
+			Return:
+				A list of the removed batch notifications, sorted by the time they were added.
+		"""
+		...
+
+
 	#
 	#	Statistic operations
 	#
@@ -212,6 +212,12 @@ class PostgreSQLBinding(DBBinding):
 				)
 			''')
 
+			# Index for looking up the batchNotifications of a ri/nu in the order they were added
+			cursor.execute(f'''
+				CREATE INDEX IF NOT EXISTS idx_batchnotifications_ri_nu_id 
+				ON {self.tableBatchNotifications} ((batch->>'ri'), (batch->>'nu'), id)
+			''')
+
 			# Create the schedules table
 			cursor.execute(f'''
 				CREATE TABLE IF NOT EXISTS {self.tableSchedules} (
@@ -351,10 +357,18 @@ class PostgreSQLBinding(DBBinding):
 					WHERE batch->>'ri' = $1 AND batch->>'nu' = $2;
 				PREPARE getBatchNotifications AS
 					SELECT batch FROM {self.tableBatchNotifications} 
-					WHERE batch->>'ri' = $1 AND batch->>'nu' = $2;
+					WHERE batch->>'ri' = $1 AND batch->>'nu' = $2
+					ORDER BY id;
 				PREPARE deleteBatchNotification AS
 					DELETE FROM {self.tableBatchNotifications} 
 					WHERE batch->>'ri' = $1 AND batch->>'nu' = $2;
+				PREPARE drainBatchNotifications AS
+					WITH d AS (
+						DELETE FROM {self.tableBatchNotifications} 
+						WHERE batch->>'ri' = $1 AND batch->>'nu' = $2
+						RETURNING id, batch
+					)
+					SELECT batch FROM d ORDER BY id;
 			''')
 
 			# Prepare statistics operations
@@ -785,6 +799,12 @@ class PostgreSQLBinding(DBBinding):
 		# L.isDebug and L.logDebug(f'Removing batch notifications for resource {ri} and notification URI {nu}')
 		return self._executePrepared('deleteBatchNotification (%s, %s)', (ri, nu))
 
+
+	def drainBatchNotifications(self, ri:str, nu:str) -> list[JSON]:
+		# L.isDebug and L.logDebug(f'Draining batch notifications for resource {ri} and notification URI {nu}')
+		return self._executePrepared('drainBatchNotifications (%s, %s)', (ri, nu), 
+									 lambda c: self._fetchAllRows(c))
+
 	#
 	#	Statistic operations
 	#
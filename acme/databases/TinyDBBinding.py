@@ -629,6 +629,13 @@ class TinyDBBinding(DBBinding):
 			return len(self.tabBatchNotifications.remove((self.batchNotificationQuery.ri == ri) & (self.batchNotificationQuery.nu == nu))) > 0
 
 
+	def drainBatchNotifications(self, ri:str, nu:str) -> list[JSON]:
+		with self.lockBatchNotifications:
+			if (notifications := self.tabBatchNotifications.search((self.batchNotificationQuery.ri == ri) & (self.batchNotificationQuery.nu == nu))):
+				self.tabBatchNotifications.remove(doc_ids = [ n.doc_id for n in notifications ])
+			return sorted(notifications, key = lambda x: x['tstamp'])
+
+
 	#
 	#	Statistics
 	#
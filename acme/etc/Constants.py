@@ -85,6 +85,9 @@ class Constants(object):
 	attrAnnouncedTo = '__announcedTo__'			# List
 	""" Constant: Name of the 'Resource' internal *__announcedTo__* attribute. This attribute holds internal announcement information. """
 
+	attrAtOriginators = '__atOriginators__'		# List
+	""" Constant: Name of the 'Resource' internal *__atOriginators__* attribute. This attribute holds all leading path segments of the *at* entries, ie. the originators that may update the resource as an announcement target. """
+
 	attrCreatedInternallyRI = '__createdInternallyRI__'
 	""" Constant: Name of the `Resource` internal *__createdInternally__* attribute. This attribute indicates whether a resource was created internally or by an external request. """
 
@@ -351,6 +351,6 @@ def getIdFromOriginator(originator: str, idOnly:Optional[bool] = False) -> str:
 			Resource ID.
 	"""
 	if idOnly:
-		return originator.split("/")[-1] if originator else originator
+		return originator.rpartition('/')[2] if originator else originator
 	else:
-		return originator.split("/")[-1] if originator and originator.startswith('/') else originator
+		return originator.rpartition('/')[2] if originator and originator.startswith('/') else originator
@@ -430,7 +430,10 @@ class ResourceTypes(ACMEIntEnum):
 			Return:
 				The full name of the resource type.
 		"""
-		return _ResourceTypeDetails.get(ResourceTypes(ty)).fullName
+		try:
+			return _ResourceTypesFullNames[ty]
+		except KeyError:
+			return _ResourceTypeDetails.get(ResourceTypes(ty)).fullName	# Raises an exception for an unknown type
 	
 	
 	def __str__(self) -> str:
@@ -623,22 +626,22 @@ _ResourceTypesSupportedResourceTypes:list[ResourceTypes] = [ t
 _ResourceTypesSupportedResourceTypes.sort()
 
 
-_ResourceTypesVirtualResourcesSet = [ t
+_ResourceTypesVirtualResourcesSet = { t
 									  for t, d in _ResourceTypeDetails.items()
-									  if d.virtualResourceName ]
-""" List of virtual resources. """
+									  if d.virtualResourceName }
+""" Set of virtual resources. """
 
 
-_ResourceTypesInstanceResourcesSet = [ t
+_ResourceTypesInstanceResourcesSet = { t
 									   for t, d in _ResourceTypeDetails.items()
-									   if d.isInstanceResource ]
-"""	List of instance resources. """
+									   if d.isInstanceResource }
+"""	Set of instance resources. """
 
 
-_ResourceTypesContainerResourcesSet = [ t
+_ResourceTypesContainerResourcesSet = { t
 									   for t, d in _ResourceTypeDetails.items()
-									   if d.isContainer ]
-"""	List of container resources. """
+									   if d.isContainer }
+"""	Set of container resources. """
 
 
 _ResourceTypesVirtualResourcesNames = [ d.virtualResourceName
@@ -648,6 +651,11 @@ _ResourceTypesVirtualResourcesNames = [ d.virtualResourceName
 _ResourceTypesVirtualResourcesNames = list(set(_ResourceTypesVirtualResourcesNames))	# unique names
 
 
+_ResourceTypesFullNames:dict[int, str] = { t : d.fullName
+											for t, d in _ResourceTypeDetails.items() }
+"""	Mapping between resource types and their full names. """
+
+
 _ResourceTypesNames = { t : d.typeName
 						for t, d in _ResourceTypeDetails.items()
 						if not d.isInternalType }
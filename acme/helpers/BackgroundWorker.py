@@ -601,6 +601,8 @@ class BackgroundWorkerPool(object):
 	"""	Lock for the *workerQueue*. """
 	timerLock:Lock					 				= Lock()
 	"""	Lock for the *workerTimer*. """
+	workersLock:RLock								= RLock()
+	"""	Lock for adding, removing, and iterating the workers in *backgroundWorkers*. """
 
 
 	def __new__(cls, *args:str, **kwargs:str) -> BackgroundWorkerPool:
@@ -666,22 +668,23 @@ class BackgroundWorkerPool(object):
 				BackgroundWorker
 
 		"""
-		# Get a unique worker ID
-		while True:
-			if (id := random.randint(1,sys.maxsize)) not in cls.backgroundWorkers:
-				break
-		worker = BackgroundWorker(interval, 
-								  workerCallback, 
-								  name, 
-								  startWithDelay, 
-								  maxCount = maxCount, 
-								  dispose = dispose, 
-								  id = id, 
-								  runOnTime = runOnTime, 
-								  runPastEvents = runPastEvents, 
-								  ignoreException = ignoreException,
-								  data = data)
-		cls.backgroundWorkers[id] = worker
+		with cls.workersLock:
+			# Get a unique worker ID
+			while True:
+				if (id := random.randint(1,sys.maxsize)) not in cls.backgroundWorkers:
+					break
+			worker = BackgroundWorker(interval, 
+									  workerCallback, 
+									  name, 
+									  startWithDelay, 
+									  maxCount = maxCount, 
+									  dispose = dispose, 
+									  id = id, 
+									  runOnTime = runOnTime, 
+									  runPastEvents = runPastEvents, 
+									  ignoreException = ignoreException,
+									  data = data)
+			cls.backgroundWorkers[id] = worker
 		return worker
 
 
@@ -729,6 +732,29 @@ class BackgroundWorkerPool(object):
 							 data = data)
 
 
+	@classmethod
+	def getOrCreateActor(cls, name:str, factory:Callable[[], BackgroundWorker]) -> Tuple[BackgroundWorker, bool]:
+		"""	Return an existing worker or actor with exactly the given *name*, or create a new one.
+
+			The check and the creation are done atomically, so that concurrent callers
+			never create more than one worker with the same name.
+
+			Args:
+				name: Name of the worker. This is matched literally, without wildcards.
+				factory: Callable that creates the new worker, e.g. by calling `newActor()`, if none exists yet.
+					The new worker must be created with the same *name*.
+
+			Return:
+				Tuple (worker, created). *created* is *True* if the worker was newly created by the *factory*.
+				A new worker is not started automatically.
+		"""
+		with cls.workersLock:
+			for w in cls.backgroundWorkers.values():
+				if w.name == name:
+					return (w, False)
+			return (factory(), True)
+
+
 	@classmethod
 	def findWorkers(cls, name:Optional[str] = None, running:Optional[bool] = None) -> List[BackgroundWorker]:
 		"""	Find and return a list of worker(s) that match the search criteria.
@@ -741,7 +767,8 @@ class BackgroundWorkerPool(object):
 			Return:
 				A list of `BackgroundWorker` objects, or an empty list.
 		"""
-		return [ w for w in cls.backgroundWorkers.values() if (not name or simpleMatch(w.name, name)) and (not running or running == w.running) ]
+		with cls.workersLock:
+			return [ w for w in cls.backgroundWorkers.values() if (not name or simpleMatch(w.name, name)) and (not running or running == w.running) ]
 
 
 	@classmethod
@@ -829,8 +856,9 @@ class BackgroundWorkerPool(object):
 			Args:
 				worker: Backgroundworker objects to remove.
 			"""
-		if worker and worker.id in cls.backgroundWorkers:
-			del cls.backgroundWorkers[worker.id]
+		if worker:
+			with cls.workersLock:
+				cls.backgroundWorkers.pop(worker.id, None)
 
 
 	@classmethod
@@ -13,6 +13,7 @@
 from typing import Optional, Any, Dict, Union, Callable, List
 
 import base64, binascii, re, json, unicodedata
+from functools import lru_cache
 
 _commentRegex = re.compile(r'(\".*?(?<!\\)\".*?(?<!\\))|(/\*.*?\*/|//[^\r\n]*$|#[^\r\n]*$|;;[^\r\n]*$)',
 						   re.MULTILINE|re.DOTALL)
@@ -622,3 +623,55 @@ def simpleMatch(st:str, pattern:str, star:Optional[str] = '*', ignoreCase:bool =
 		return stIndex == stLen-1
 	
 	return _simpleMatch(st, pattern)
+
+
+@lru_cache(maxsize = 256)
+def compileSimpleMatchPatterns(patterns:tuple[str, ...], star:Optional[str] = '*', ignoreCase:bool = False) -> Optional[re.Pattern]:
+	r"""	Compile one or more *simpleMatch()* patterns into a single regular expression.
+
+		The returned expression is an alternation of all *patterns*, and its *fullmatch()* method
+		returns a match if any of the patterns would match a string with *simpleMatch()*.
+		Compiled expressions are cached.
+
+		Args:
+			patterns: Tuple of pattern strings.
+			star: optionally specify a different character as the star character
+			ignoreCase: ignore case in the comparison
+
+		Return:
+			The compiled regular expression, or *None* if *patterns* is empty.
+	"""
+
+	def _toRegex(pattern:str) -> str:
+		"""	Translate a single *simpleMatch()* pattern into a regular expression.
+
+			Args:
+				pattern: The pattern string.
+
+			Return:
+				The regular expression string.
+		"""
+		result:list[str] = []
+		index = 0
+		patternLen = len(pattern)
+		while index < patternLen:
+			p = pattern[index]
+			match p:
+				case '?':
+					result.append('.')
+				case p if p == star:
+					result.append('.*')
+				case '+':
+					result.append('.+')
+				case '\\' if index + 1 < patternLen:
+					index += 1
+					result.append(re.escape(pattern[index]))
+				case _:
+					result.append(re.escape(p))
+			index += 1
+		return ''.join(result)
+
+	if not patterns:
+		return None
+	return re.compile('|'.join(f'(?:{_toRegex(pattern)})' for pattern in patterns),
+					  re.DOTALL | (re.IGNORECASE if ignoreCase else 0))
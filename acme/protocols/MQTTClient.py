@@ -232,7 +232,7 @@ class MQTTClientHandler(MQTTHandler):
 			if Configuration.mqtt_security_allowedCredentialIDs:
 				#L.logWarn(Configuration.mqtt_security_allowedCredentialIDs)
 				# The requestOriginator is actually a Credential ID. Check whether it is allowed
-				if not CSE.security.isAllowedOriginator(requestOriginator, Configuration.mqtt_security_allowedCredentialIDs):
+				if not CSE.security.isAllowedOriginator(requestOriginator, CSE.security.allowedCredentialIDs):
 					CSE.request.recordRequest(dissectResult.request, dissectResult)
 					_logRequest(dissectResult)
 					_sendResponse(Result(rsc = ResponseStatusCode.ORIGINATOR_HAS_NO_PRIVILEGE, 
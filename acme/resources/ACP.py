@@ -7,9 +7,15 @@
 """ AccessControlPolicy (ACP) resource type. """
 
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Callable
 
-from ..helpers.TextTools import findXPath
+import re
+from sys import intern
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+from ..helpers.TextTools import findXPath, compileSimpleMatchPatterns
 from ..etc.Types import AttributePolicyDict, ResourceTypes, Permission, JSON
 from ..etc.ResponseStatusCodes import BAD_REQUEST
 from ..etc.Constants import Constants, RuntimeConstants as RC
@@ -23,7 +29,168 @@ from ..resources.AnnounceableResource import AnnounceableResource
 addToInternalAttributes(Constants.attrRiTyMapping)
 
 
-class ACP(AnnounceableResource):
+@dataclass
+class ACPRule():
+	"""	A pre-processed *accessControlRule* of an <ACP> resource.
+
+		The rules of an <ACP> resource are compiled once per resource instance and are then
+		used by the SecurityManager for the permission checks.
+	"""
+	acop:int
+	"""	The *accessControlOperations* bit-field. """
+	acco:Optional[list[JSON]]
+	"""	The *accessControlContexts*, or *None*. """
+	acaf:bool
+	"""	Indicator whether an *accessControlAuthenticationFlag* is present. """
+	aca:Optional[list[str]]
+	"""	The *accessControlAttributes*, or *None*. """
+	hasAcod:bool
+	"""	Indicator whether *accessControlObjectDetails* are present. """
+	acodChty:frozenset[int]
+	"""	All *childResourceType* values of the *accessControlObjectDetails*. """
+	acodTy:frozenset[int]
+	"""	All *resourceType* values of the *accessControlObjectDetails*. """
+	acorHasAll:bool
+	"""	Indicator whether the *accessControlOriginators* contain *all*. """
+	acorExact:frozenset[str]
+	"""	All *accessControlOriginators*. """
+	acorWildcards:Optional[re.Pattern]
+	"""	A single compiled expression for all *accessControlOriginators* that contain wildcard characters, or *None*. """
+	acorGroups:tuple[str, ...]
+	"""	The *accessControlOriginators* that refer to <GRP> resources. """
+
+
+	@classmethod
+	def fromAcr(cls, acr:JSON, getTypeForRI:Callable[[str], Optional[int]]) -> ACPRule:
+		"""	Compile an *accessControlRule*.
+
+			Args:
+				acr: The *accessControlRule* structure.
+				getTypeForRI: A function that returns the resource type for a resource ID, or *None*.
+
+			Return:
+				The compiled rule.
+		"""
+		acod = acr.get('acod') or []
+		acor = acr.get('acor') or []
+		return cls(acop = acr['acop'],
+				   acco = acr.get('acco'),
+				   acaf = acr.get('acaf') is not None,
+				   aca = acr.get('aca'),
+				   hasAcod = len(acod) > 0,
+				   acodChty = frozenset(chty for eachAcod in acod for chty in (eachAcod.get('chty') or [])),
+				   acodTy = frozenset(t for eachAcod in acod if (t := eachAcod.get('ty')) is not None),
+				   acorHasAll = 'all' in acor,
+				   acorExact = frozenset(map(intern, acor)),	# interned, because they are compared against interned originators
+				   acorWildcards = compileSimpleMatchPatterns(tuple(a for a in acor if any(c in a for c in '*?+\\'))),
+				   acorGroups = tuple(a for a in acor if getTypeForRI(a) == ResourceTypes.GRP))
+
+
+class ACPRulesMixin():
+	"""	Compiled *accessControlRules* for the <ACP> and <ACPAnnc> resource types.
+
+		The rules are compiled on first use and kept with the resource instance. They are removed
+		when the resource is updated, and the resource is then also removed from the SecurityManager's ACP cache.
+		This class must precede the resource base class in the list of base classes.
+	"""
+
+	def _initCompiledRules(self) -> None:
+		"""	Initialize the compiled *accessControlRules*. This must be called by the resource's constructor.
+		"""
+		self._compiledRules:dict[str, list[ACPRule]] = {}	# compiled rules for 'pv' and 'pvs'. Assigned lazily
+		self._acopUnions:dict[str, int] = {}				# OR-ed acop of all rules for 'pv' and 'pvs'. Assigned lazily
+		self._rulesByPermission:dict[tuple[str, int], list[ACPRule]] = {}	# compiled rules per context and requested permission. Assigned lazily
+
+
+	def dbUpdate(self, finalize:bool = False) -> Resource:
+		# Inherited
+		self._clearCompiledRules()
+		result = super().dbUpdate(finalize)	# type: ignore [misc]
+		CSE.security.invalidateCachedACP(self.ri)	# type: ignore [attr-defined]
+		return result
+
+
+	def dbDelete(self) -> None:
+		# Inherited
+		super().dbDelete()	# type: ignore [misc]
+		CSE.security.invalidateCachedACP(self.ri)	# type: ignore [attr-defined]
+
+
+	def getTypeForRI(self, ri:str) -> Optional[int]:
+		""" Get the resource type for a resourceID in an *acor*.
+
+			Group references are not resolved by default.
+
+			Args:
+				ri: The resourceID to get the type for.
+			Return:
+				The resource type if found, or *None* otherwise.
+		"""
+		return None
+
+
+	def getCompiledRules(self, context:str) -> list[ACPRule]:
+		"""	Get the compiled *accessControlRules* of the resource.
+
+			Args:
+				context: Either 'pv' or 'pvs'.
+
+			Return:
+				List of compiled rules.
+		"""
+		if (rules := self._compiledRules.get(context)) is None:
+			rules = [ ACPRule.fromAcr(acr, self.getTypeForRI) for acr in (self[f'{context}/acr'] or []) ]	# type: ignore [index]
+			self._compiledRules[context] = rules
+			self._acopUnions[context] = reduce(or_, (acr.acop for acr in rules), 0)
+		return rules
+
+
+	def getAcopUnion(self, context:str) -> int:
+		"""	Get the combined *accessControlOperations* of all *accessControlRules* of the resource.
+
+			If a requested permission is not part of this union then none of the rules can grant it.
+
+			Args:
+				context: Either 'pv' or 'pvs'.
+
+			Return:
+				The OR-ed *acop* bit-fields of all rules.
+		"""
+		if (union := self._acopUnions.get(context)) is None:
+			self.getCompiledRules(context)
+			union = self._acopUnions[context]
+		return union
+
+
+	def getCompiledRulesForPermission(self, context:str, permission:int) -> list[ACPRule]:
+		"""	Get the compiled *accessControlRules* of the resource whose *accessControlOperations*
+			contain any of the bits of *permission*.
+
+			The result is kept per context and permission, so rules that cannot grant a permission
+			are not visited again for further checks of the same permission.
+
+			Args:
+				context: Either 'pv' or 'pvs'.
+				permission: The requested permission.
+
+			Return:
+				List of compiled rules.
+		"""
+		if (rules := self._rulesByPermission.get((context, permission))) is None:
+			rules = [ acr for acr in self.getCompiledRules(context) if acr.acop & permission ]
+			self._rulesByPermission[(context, permission)] = rules
+		return rules
+
+
+	def _clearCompiledRules(self) -> None:
+		"""	Remove the compiled *accessControlRules* and *acop* unions after a change of the rules.
+		"""
+		self._compiledRules.clear()
+		self._acopUnions.clear()
+		self._rulesByPermission.clear()
+
+
+class ACP(ACPRulesMixin, AnnounceableResource):
 	""" AccessControlPolicy (ACP) resource type """
 
 	_allowedChildResourceTypes:list[ResourceTypes] = [ ResourceTypes.SUB ] # TODO Transaction to be added
@@ -63,6 +230,8 @@ class ACP(AnnounceableResource):
 		self.setAttribute('pv/acr', [], overwrite = False)
 		self.setAttribute('pvs/acr', [], overwrite = False)
 
+		self._initCompiledRules()
+
 
 	def validate(self, originator:Optional[str] = None, 
 					   dct:Optional[JSON] = None, 
@@ -143,6 +312,7 @@ class ACP(AnnounceableResource):
 		o = list(set(originators))	# Remove duplicates from list of originators
 		if p := self['pv/acr']:
 			p.append({'acop' : permission, 'acor': o})
+			self._clearCompiledRules()
 
 
 	def removePermissionForOriginator(self, originator:str) -> None:
@@ -155,6 +325,7 @@ class ACP(AnnounceableResource):
 			for acr in p:
 				if originator in acr['acor']:
 					p.remove(acr)
+			self._clearCompiledRules()
 					
 
 	def addSelfPermission(self, originators:List[str], permission:Permission) -> None:
@@ -166,9 +337,10 @@ class ACP(AnnounceableResource):
 		"""
 		if p := self['pvs/acr']:
 			p.append({'acop' : permission, 'acor': list(set(originators))}) 	# list(set()) : Remove duplicates from list of originators
+			self._clearCompiledRules()
 
 
-	def getTypeForRI(self, ri:str) -> Optional[str]:
+	def getTypeForRI(self, ri:str) -> Optional[int]:
 		""" Get the resource type for a resourceID.
 			Args:
 				ri: The resourceID to get the type for.
@@ -176,4 +348,3 @@ class ACP(AnnounceableResource):
 				The resource type if found, or *None* otherwise.
 		"""
 		return self[Constants.attrRiTyMapping].get(ri)
-
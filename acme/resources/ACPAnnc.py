@@ -9,12 +9,12 @@
 from __future__ import annotations
 from typing import Optional
 
-from ..helpers.TextTools import simpleMatch
-from ..etc.Types import AttributePolicyDict, ResourceTypes, Permission, JSON
+from ..etc.Types import AttributePolicyDict, ResourceTypes, JSON
 from ..resources.AnnouncedResource import AnnouncedResource
+from ..resources.ACP import ACPRulesMixin
 
 
-class ACPAnnc(AnnouncedResource):
+class ACPAnnc(ACPRulesMixin, AnnouncedResource):
 	""" AccessControlPolicy announced (ACPA) resource type """
 
 	_allowedChildResourceTypes:list[ResourceTypes] = [ ResourceTypes.SUB ]
@@ -49,3 +49,4 @@ class ACPAnnc(AnnouncedResource):
 	def __init__(self, dct:JSON, pi:Optional[str] = None, create:Optional[bool] = False) -> None:
 		super().__init__(ResourceTypes.ACPAnnc, dct, pi = pi, create = create)
 
+		self._initCompiledRules()
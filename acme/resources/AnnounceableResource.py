@@ -22,6 +22,7 @@ from .Resource import Resource, addToInternalAttributes
 
 # Add to internal attributes
 addToInternalAttributes(Constants.attrAnnouncedTo) # add announcedTo to internal attributes
+addToInternalAttributes(Constants.attrAtOriginators) # add atOriginators to internal attributes
 
 
 class AnnounceableResource(Resource):
@@ -306,6 +307,29 @@ class AnnounceableResource(Resource):
 		return mandatory + optional
 
 
+	def dbCreate(self, overwrite:Optional[bool] = False) -> None:
+		# Inherited
+		self._updateAtOriginators()
+		super().dbCreate(overwrite)
+
+
+	def dbUpdate(self, finalize:bool = False) -> Resource:
+		# Inherited
+		self._updateAtOriginators()
+		return super().dbUpdate(finalize)
+
+
+	def _updateAtOriginators(self) -> None:
+		"""	Update the internal *atOriginators* attribute from the current *at* attribute.
+
+			The attribute contains every leading part of an *at* entry that is followed by a "/".
+			An originator is then an announcement target of the resource if it is in this list.
+			The list is sorted so that it can be searched with a binary search.
+		"""
+		self.setAttribute(Constants.attrAtOriginators, 
+						  sorted({ each[:index] for each in (self.at or []) for index, c in enumerate(each) if c == '/' }))
+
+
 	def getAnnouncedTo(self) -> list[Tuple[str, str]]:
 		"""	Return the internal *announcedTo* list attribute of a resource.
 
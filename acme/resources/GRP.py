@@ -95,3 +95,14 @@ class GRP(AnnounceableResource):
 		CSE.groupResource.validateGroup(self, originator)
 
 
+	def dbUpdate(self, finalize:bool = False) -> Resource:
+		# Inherited
+		result = super().dbUpdate(finalize)
+		CSE.security.invalidateCachedGroup(self.ri)
+		return result
+
+
+	def dbDelete(self) -> None:
+		# Inherited
+		super().dbDelete()
+		CSE.security.invalidateCachedGroup(self.ri)
@@ -660,6 +660,20 @@ class Storage(object):
 		return self.db.removeBatchNotifications(ri, nu)
 
 
+	def drainBatchNotifications(self, ri:str, nu:str) -> list[JSON]:
+		"""	Retrieve and remove the batch notifications for a target resource and a notification URI
+			in a single operation.
+
+			Args:
+				ri: The resource ID of the target resource.
+				nu: The notification URI.
+			
+			Return:
+				List of the removed batch notifications, sorted by the time they were added.
+		"""
+		return self.db.drainBatchNotifications(ri, nu)
+
+
 	#########################################################################
 	##
 	##	Statistics
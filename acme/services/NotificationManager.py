@@ -14,6 +14,7 @@ from __future__ import annotations
 from typing import Callable, Union, Any, cast, Optional
 
 import sys, copy
+from dataclasses import dataclass, field
 from threading import Lock, current_thread
 
 import isodate
@@ -42,6 +43,16 @@ SenderFunction = Callable[[str], bool]	# type:ignore[misc] # bc cyclic definitio
 """ Type definition for sender callback function. """
 
 
+@dataclass
+class _BatchNotificationTargetLock():
+	"""	Lock for sending the batch notifications of a single subscription and notification URI in order.
+	"""
+	lock:Lock = field(default_factory = Lock)
+	"""	The lock. """
+	users:int = 0
+	"""	The number of threads that hold or wait for the lock. The lock is removed when it is not used anymore. """
+
+
 class NotificationManager(object):
 	"""	This class defines functionalities to handle subscriptions and notifications.
 
@@ -52,6 +63,7 @@ class NotificationManager(object):
 	__slots__ = (
 		'lockBatchNotification',
 		'lockNotificationEventStats',
+		'_batchNotificationTargetLocks',
 
 		'_eventNotification',
 	)
@@ -63,6 +75,7 @@ class NotificationManager(object):
 
 		self.lockBatchNotification = Lock()					# Lock for batchNotifications
 		self.lockNotificationEventStats = Lock()			# Lock for notificationEventStats
+		self._batchNotificationTargetLocks:dict[str, _BatchNotificationTargetLock] = {}	# Locks for sending the batch notifications of a single ri & nu in order
 
 		CSE.event.addHandler(CSE.event.cseReset, self.restart)		# type: ignore
 		
@@ -98,6 +111,9 @@ class NotificationManager(object):
 		for worker in periodicWorkers:
 			worker.start(**worker.args)
 
+		with self.lockBatchNotification:
+			self._batchNotificationTargetLocks.clear()
+
 		L.isDebug and L.logDebug('NotificationManager restarted')
 
 	###########################################################################
@@ -1287,7 +1303,7 @@ class NotificationManager(object):
 		"""	Send and remove any outstanding batch notifications for a subscription.
 		"""
 		# TODO doc
-		L.isDebug and L.logDebug(f'Flush batch notification')
+		L.isDebug and L.logDebug('Flush batch notification')
 
 		ri = subscription.ri
 		# Get the subscription information (not the <sub> resource itself!).
@@ -1347,61 +1363,73 @@ class NotificationManager(object):
 			Return:
 				Indication of the success of the sending.
 		"""
+		L.isDebug and L.logDebug(f'Sending aggregated subscription notifications for ri: {ri}')
+
+		# Sending the batches of a single target is serialized, so that they arrive in order. The batch
+		# notifications of different targets are collected and sent in parallel.
+		workerID = self._workerID(ri, nu)
 		with self.lockBatchNotification:
-			L.isDebug and L.logDebug(f'Sending aggregated subscription notifications for ri: {ri}')
-
-			# Collect the stored notifications for the batch and aggregate them
-			notifications = []
-			for notification in sorted(CSE.storage.getBatchNotifications(ri, nu), key = lambda x: x['tstamp']):	# type: ignore[no-any-return] # sort by timestamp added
-				if n := findXPath(notification['request'], 'sgn'):
-					notifications.append(n)
-			if (notificationCount := len(notifications)) == 0:	# This can happen when the subscription is deleted and there are no outstanding notifications
-				return False
+			targetLock = self._batchNotificationTargetLocks.setdefault(workerID, _BatchNotificationTargetLock())
+			targetLock.users += 1
+		try:
+			with targetLock.lock:
+				return self._collectAndSendBatchNotification(ri, nu, ln, sub)
+		finally:
+			with self.lockBatchNotification:
+				targetLock.users -= 1
+				if targetLock.users == 0 and self._batchNotificationTargetLocks.get(workerID) is targetLock:
+					del self._batchNotificationTargetLocks[workerID]	# Not used by any other thread anymore
 
-			parameters:CSERequest = None
-			ec:EventCategory = None
-			if ln:
-				notifications = notifications[-1:]
-				# Add event category
-				ec = EventCategory.Latest
 
-			# Aggregate and send
-			notificationRequest:JSON = {
-				'm2m:agn' : {
-					 'm2m:sgn' : notifications 
-				}
-			}
+	def _collectAndSendBatchNotification(self, ri:str, nu:str, ln:bool, sub:JSON) -> bool:
+		"""	Collect, remove, and send the available BatchNotifications for an ri & nu.
+			The caller must hold the target's lock.
 
-			# Delete old notifications
-			if not CSE.storage.removeBatchNotifications(ri, nu):
-				L.isWarn and L.logWarn('Error removing aggregated batch notifications')
+			Args:
+				ri: Resource ID of the <sub> or <crs> resource.
+				nu: A single notification URI.
+				ln: *latestNotify*, if *True* then only send the latest notification.
+				sub: The internal *sub* structure.
+			
+			Return:
+				Indication of the success of the sending.
+		"""
+		with self.lockBatchNotification:
+			# Retrieve and delete the stored notifications in one go, so that a notification that is stored 
+			# in the meantime is not removed unsent. They are already sorted by timestamp
+			notifications = [ n for notification in CSE.storage.drainBatchNotifications(ri, nu) 
+								if (n := notification['request'].get('sgn')) ]
+			if not notifications:	# This can happen when the subscription is deleted and there are no outstanding notifications
 				return False
+			notificationCount = len(notifications)
+			if ln:	# Only send the latest notification
+				notifications = notifications[-1:]
 
-			# If nse is set to True then count this notification request
-			subscription = None
-			nse = sub['nse']
-			if nse:
-				try:
-					subscription = cast(SUB, CSE.dispatcher.retrieveResource(sub['ri']))
-				except ResponseException as e:
-					L.logErr(f'Cannot retrieve <sub> resource: {sub["ri"]}: {e.dbg}')
-					return False
-				self.countSentReceivedNotification(subscription, nu, count = notificationCount)	# count sent notification
-				
-			# Send the request
+		# If nse is set to True then count this notification request
+		subscription = None
+		nse = sub['nse']
+		if nse:
 			try:
-				CSE.request.handleSendRequest(CSERequest(op = Operation.NOTIFY,
-														 to = nu, 
-														 originator = RC.cseCsi,
-														 pc = notificationRequest,
-														 ec = ec))
+				subscription = cast(SUB, CSE.dispatcher.retrieveResource(sub['ri']))
 			except ResponseException as e:
-				L.isWarn and L.logWarn(f'Error sending aggregated batch notifications: {e.dbg}')
+				L.logErr(f'Cannot retrieve <sub> resource: {sub["ri"]}: {e.dbg}')
 				return False
-			if nse:
-				self.countSentReceivedNotification(subscription, nu, isResponse = True, count = notificationCount) # count received notification
+			self.countSentReceivedNotification(subscription, nu, count = notificationCount)	# count sent notification
+		
+		# Send the request
+		try:
+			CSE.request.handleSendRequest(CSERequest(op = Operation.NOTIFY,
+													 to = nu, 
+													 originator = RC.cseCsi,
+													 pc = { 'm2m:agn' : { 'm2m:sgn' : notifications } },	# Aggregate
+													 ec = EventCategory.Latest if ln else None))
+		except ResponseException as e:
+			L.isWarn and L.logWarn(f'Error sending aggregated batch notifications: {e.dbg}')
+			return False
+		if nse:
+			self.countSentReceivedNotification(subscription, nu, isResponse = True, count = notificationCount) # count received notification
 
-			return True
+		return True
 
 
 	def _startNewBatchNotificationWorker(self, ri:str, nu:str, ln:bool, sub:JSON, dur:float) -> bool:
@@ -1410,21 +1438,25 @@ class NotificationManager(object):
 			L.logErr('BatchNotification duration is < 1')
 			return False
 		# Check and start a notification worker to send notifications after some time
-		if len(BackgroundWorkerPool.findWorkers(self._workerID(ri, nu))) > 0:	# worker started, return
-			return True
-		L.isDebug and L.logDebug(f'Starting new batchNotificationsWorker. Duration : {dur:f} seconds')
-		BackgroundWorkerPool.newActor(self._sendSubscriptionAggregatedBatchNotification, 
-									  delay = dur,
-									  name = self._workerID(ri, nu)).start(ri = ri, nu = nu, ln = ln, sub = sub)
+		workerID = self._workerID(ri, nu)
+		worker, created = BackgroundWorkerPool.getOrCreateActor(workerID, 
+																lambda: BackgroundWorkerPool.newActor(self._sendSubscriptionAggregatedBatchNotification, 
+																									  delay = dur,
+																									  name = workerID))
+		if created:	# otherwise a worker is already started
+			L.isDebug and L.logDebug(f'Starting new batchNotificationsWorker. Duration : {dur:f} seconds')
+			worker.start(ri = ri, nu = nu, ln = ln, sub = sub)
 		return True
 
 
-	def _stopNotificationBatchWorker(self, ri:str, nu:str) -> None:
+	@staticmethod
+	def _stopNotificationBatchWorker(ri:str, nu:str) -> None:
 		# TODO doc
-		BackgroundWorkerPool.stopWorkers(self._workerID(ri, nu))
+		BackgroundWorkerPool.stopWorkers(NotificationManager._workerID(ri, nu))
 
 
-	def _workerID(self, ri:str, nu:str) -> str:
+	@staticmethod
+	def _workerID(ri:str, nu:str) -> str:
 		"""	Return an ID for a batch notification background worker.
 		
 			Args:
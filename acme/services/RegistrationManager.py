@@ -202,7 +202,7 @@ class RegistrationManager(object):
 
 		# Check for allowed orginator
 		# TODO also allow when there is an ACP?
-		if not CSE.security.isAllowedOriginator(originator, Configuration.cse_registration_allowedAEOriginators):
+		if not CSE.security.isAllowedOriginator(originator, CSE.security.allowedAEOriginators):
 			raise APP_RULE_VALIDATION_FAILED(L.logDebug('Originator not allowed'))
 
 		# Assign originator for the AE
@@ -10,26 +10,52 @@
 
 
 from __future__ import annotations
-from typing import List, cast, Optional, Any
+from typing import List, Optional, Any
 
-import ssl
+import ssl, re
+from bisect import bisect_left
+from sys import intern
+from threading import Lock
 from dataclasses import dataclass
 
 from ..etc.Types import ResourceTypes, Permission, CSERequest
 from ..etc.ResponseStatusCodes import ResponseException, BAD_REQUEST, ORIGINATOR_HAS_NO_PRIVILEGE, NOT_FOUND
-from ..etc.IDUtils import isSPRelative, toCSERelative, getIdFromOriginator
+from ..etc.IDUtils import isSPRelative, toCSERelative, getIdFromOriginator, localResourceID
 from ..etc.DateUtils import utcDatetime, cronMatchesTimestamp
-from ..etc.Constants import RuntimeConstants as RC
-from ..helpers.TextTools import findXPath, simpleMatch
+from ..etc.Constants import Constants, RuntimeConstants as RC
+from ..helpers.TextTools import compileSimpleMatchPatterns
 from ..runtime import CSE
 from ..runtime.Configuration import Configuration
 from ..resources.Resource import Resource, isInternalAttribute
 from ..resources.PCH import PCH
 from ..resources.PCH_PCU import PCH_PCU
-from ..resources.ACP import ACP
+from ..resources.ACP import ACP, ACPRule
 from ..resources.ACPAnnc import ACPAnnc
 from ..runtime.Logging import Logging as L
 
+
+_authConfigKeys:frozenset[str] = frozenset({	'http.security.caCertificateFile',
+												'http.security.caPrivateKeyFile',
+												'http.security.basicAuthFile',
+												'http.security.tokenAuthFile',
+												'websocket.security.caCertificateFile',
+												'websocket.security.caPrivateKeyFile',
+										   })
+""" Configuration keys that cause the authentication files to be read again when they are updated. """
+
+_allowedOriginatorsConfigKeys:frozenset[str] = frozenset({	'cse.registration.allowedAEOriginators',
+															'cse.registration.allowedCSROriginators',
+															'mqtt.security.allowedCredentialIDs',
+													   })
+""" Configuration keys that cause the allowed originators to be compiled again when they are updated. """
+
+_tlsVersions:dict[str, int] = {	'tls1.1' : ssl.PROTOCOL_TLSv1_1,
+									'tls1.2' : ssl.PROTOCOL_TLSv1_2,
+									'auto'   : ssl.PROTOCOL_TLS,			# since Python 3.6. Automatically choose the highest protocol version between client & server
+								 }
+""" Mapping of the configured TLS versions to the SSL protocols. """
+
+
 @dataclass
 class ACPResult():
 	"""	An ACP result structure.
@@ -46,14 +72,49 @@ class SecurityManager(object):
 	__slots__ = (
 		'httpBasicAuthData',
 		'httpTokenAuthData',
+		'_acpCache',
+		'_acpCacheKeys',
+		'_acpCacheVersion',
+		'_acpCacheLock',
+		'_grpMidCache',
+		'_grpMidCacheLock',
+		'_sslContexts',
+		'hasAccess',
+		'allowedAEOriginators',
+		'allowedCSROriginators',
+		'allowedCredentialIDs',
 	)
 
+	_acpCacheSize = 4096
+	""" Maximum number of entries in the ACP cache. """
+
+	_grpMidCacheSize = 4096
+	""" Maximum number of entries in the group membership cache. """
+
 
 	def __init__(self) -> None:
 
+		# Cache for local <ACP> and <ACPAnnc> resources, indexed by the acpi entries that refer to them
+		self._acpCache:dict[str, Resource] = {}
+		# The cache keys for each cached resource ID. The same resource may be cached for an ri and a srn
+		self._acpCacheKeys:dict[str, set[str]] = {}
+		# Incremented with every invalidation. An entry is only added when no invalidation happened while it was retrieved
+		self._acpCacheVersion = 0
+		self._acpCacheLock = Lock()
+
+		# Cache for the members of <GRP> resources that are referenced in acor entries, indexed by those entries.
+		# The values are tuples of the <GRP> resource ID and the member IDs
+		self._grpMidCache:dict[str, tuple[str, frozenset[str]]] = {}
+		self._grpMidCacheLock = Lock()
+
+		# SSL contexts that have been created for the protocol bindings, indexed by the configuration section
+		self._sslContexts:dict[str, ssl.SSLContext] = {}
+
 		# Get the configuration settings
 		self._readHttpBasicAuthFile()
 		self._readHttpTokenAuthFile()
+		self._assignHasAccess()
+		self._compileAllowedOriginators()
 
 		# Add a handler when the CSE is reset
 		CSE.event.addHandler(CSE.event.cseReset, self.restart)	# type: ignore
@@ -78,6 +139,12 @@ class SecurityManager(object):
 		"""
 		self._readHttpBasicAuthFile()
 		self._readHttpTokenAuthFile()
+		with self._acpCacheLock:
+			self._acpCache.clear()
+			self._acpCacheKeys.clear()
+			self._acpCacheVersion += 1
+		with self._grpMidCacheLock:
+			self._grpMidCache.clear()
 		L.logDebug('SecurityManager restarted')
 
 
@@ -91,13 +158,18 @@ class SecurityManager(object):
 				key: The key of the configuration value.
 				value: The new value of the configuration value.
 		"""
-		if key not in (	'http.security.caCertificateFile',
-						'http.security.caPrivateKeyFile',
-						'http.security.basicAuthFile',
-						'http_security_tokenAuthFile',
-						'websocket.security.caCertificateFile',
-						'websocket.security.caPrivateKeyFile',
-					  ):
+		if key == 'cse.security.enableACPChecks':
+			self._assignHasAccess()
+			return
+		if key in _allowedOriginatorsConfigKeys:
+			self._compileAllowedOriginators()
+			return
+
+		# Create the SSL context of a protocol binding again when any of its security settings changes
+		if key and (section := key.partition('.security.')[0]) != key:
+			self._sslContexts.pop(section, None)
+
+		if key not in _authConfigKeys:
 			return
 		self._readHttpBasicAuthFile()
 		self._readHttpTokenAuthFile()
@@ -106,7 +178,34 @@ class SecurityManager(object):
 	###############################################################################################
 
 
-	def hasAccess(self, originator:str, 
+	def _assignHasAccess(self) -> None:
+		"""	Assign the `hasAccess()` method depending on whether ACP checks are enabled.
+
+			When the checks are disabled then `hasAccess()` grants access without any further tests.
+		"""
+		self.hasAccess = self._hasAccess if Configuration.cse_security_enableACPChecks else self._grantAccess
+
+
+	def _compileAllowedOriginators(self) -> None:
+		"""	Compile the lists of allowed originators and credential IDs from the configuration
+			into regular expressions, which are used by `isAllowedOriginator()`.
+		"""
+		self.allowedAEOriginators = compileSimpleMatchPatterns(tuple(Configuration.cse_registration_allowedAEOriginators or ()))
+		self.allowedCSROriginators = compileSimpleMatchPatterns(tuple(Configuration.cse_registration_allowedCSROriginators or ()))
+		self.allowedCredentialIDs = compileSimpleMatchPatterns(tuple(Configuration.mqtt_security_allowedCredentialIDs or ()))
+
+
+	@staticmethod
+	def _grantAccess(*args:Any, **kwargs:Any) -> bool:
+		"""	Access check that always grants access. It is assigned to `hasAccess()` when ACP checks are disabled.
+
+			Return:
+				Always *True*.
+		"""
+		return True
+
+
+	def _hasAccess(self, originator:str, 
 						resource:Resource, 
 						requestedPermission:Permission, 
 						ty:Optional[ResourceTypes] = None, 
@@ -114,6 +213,8 @@ class SecurityManager(object):
 						request:Optional[CSERequest] = None,
 						resultResource:Optional[Resource] = None) -> bool:
 		""" Test whether an originator has access to a resource for the requested permission.
+
+			This method is assigned to `hasAccess()` when ACP checks are enabled.
 		
 			Args:
 				originator: The originator to check for.
@@ -124,42 +225,6 @@ class SecurityManager(object):
 			Return:
 				Boolean indicating access.
 		"""
-
-		def _checkACPI(originator:str, acpRi:str, requestedPermission:Permission, ty:ResourceTypes) -> ACPResult:
-			""" Check the access control policy for a single ACP resource.
-
-				Args:
-					originator: The originator to check for.
-					acpRo: The resourceID of the ACP resource.
-					requestedPermission: The permission to check.
-					ty: The resource type to check for.
-
-				Return:
-					A data structure with the result of the check.
-
-			"""
-			try:
-				if not (acp := CSE.dispatcher.retrieveResource(acpRi)):	# resource could be on another CSE
-					L.isDebug and L.logDebug(f'ACP resource not found: {acpRi}')
-					return ACPResult(False, [])
-				
-				# check general operation permission. This also returns the attributes (if any)
-				result = self.checkSingleACPPermission(cast(ACP, acp), originator, requestedPermission, ty)
-				if result.allowed:
-					return result
-				if result.attributes:
-					# L.isDebug and L.logDebug(f'Attributes to check further attributes {result.attributes}')
-					return result
-			except ResponseException as e:
-				L.isDebug and L.logDebug(f'ACP resource not found: {acpRi}: {e.dbg}')
-				return ACPResult(False, [])
-			return ACPResult(False, [])
-
-
-		#  Do or ignore the check
-		if not Configuration.cse_security_enableACPChecks:
-			return True
-		
 		#
 		# grant full access to the CSE originator
 		#
@@ -181,6 +246,7 @@ class SecurityManager(object):
 			L.isDebug and L.logDebug(f'Originator: {originator} is registered to same CSE. Converting it to CSE-Relative format.')
 			originator = toCSERelative(originator)
 			L.isDebug and L.logDebug(f'Converted originator: {originator}')
+		originator = intern(originator)	# The originator is compared against interned acor and mid entries
 
 		#
 		#	Check parameters
@@ -201,13 +267,13 @@ class SecurityManager(object):
 						# originator may be None or empty or C or S. 
 						# That is okay if type is AE and this is a create request
 						# Originator == None or len == 0
-						if not originator or self.isAllowedOriginator(originator, Configuration.cse_registration_allowedAEOriginators):
+						if not originator or self.isAllowedOriginator(originator, self.allowedAEOriginators):
 							L.isDebug and L.logDebug('Originator for AE CREATE. OK.')
 							return True
 						# fall-through
 					
 					case ResourceTypes.CSR | ResourceTypes.CSEBaseAnnc:
-						if self.isAllowedOriginator(originator, Configuration.cse_registration_allowedCSROriginators):
+						if self.isAllowedOriginator(originator, self.allowedCSROriginators):
 							L.isDebug and L.logDebug('Originator for CSR/CSEBaseAnnc CREATE. OK.')
 							return True
 						else:
@@ -216,7 +282,7 @@ class SecurityManager(object):
 				# fall-through
 
 			if ty.isAnnounced():
-				if self.isAllowedOriginator(originator, Configuration.cse_registration_allowedCSROriginators) or (parentResource and originator[1:] == parentResource.ri):
+				if self.isAllowedOriginator(originator, self.allowedCSROriginators) or (parentResource and originator[1:] == parentResource.ri):
 					L.isDebug and L.logDebug('Originator for Announcement. OK.')
 					return True
 				else:
@@ -229,20 +295,25 @@ class SecurityManager(object):
 
 		# Allow originator for announced resource
 		if resource.isAnnounced():
-			if self.isAllowedOriginator(originator, Configuration.cse_registration_allowedCSROriginators) and resource.lnk.startswith(f'{originator}/'):
+			if self.isAllowedOriginator(originator, self.allowedCSROriginators) and resource.lnk.startswith(f'{originator}/'):
 				L.isDebug and L.logDebug('Announcement originator. OK.')
 				return True
 		
 		# Allow originator if resource is announced to the originator and the request is UPDATE
 		if (at := resource.at) is not None and requestedPermission == Permission.UPDATE:
-			ot = f'{originator}/'
-			if any(each.startswith(ot) for each in at):
+			if (atOriginators := resource[Constants.attrAtOriginators]) is not None:
+				isAnnouncementTarget = (index := bisect_left(atOriginators, originator)) < len(atOriginators) and atOriginators[index] == originator
+			else:	# resource was stored without the internal atOriginators attribute
+				ot = f'{originator}/'
+				isAnnouncementTarget = any(each.startswith(ot) for each in at)
+			if isAnnouncementTarget:
 				L.isDebug and L.logDebug('Announcement target originator. OK.')
 				return True
 
-		L.isDebug and L.logDebug(f'Permission check originator: {originator} ri: {resource.ri} permission: {requestedPermission} resource type: {resource.ty} type: {ty}')
+		resourceType = resource.ty
+		L.isDebug and L.logDebug(f'Permission check originator: {originator} ri: {resource.ri} permission: {requestedPermission} resource type: {resourceType} type: {ty}')
 
-		match resource.ty:
+		match resourceType:
 
 			# Allow some Originators to RETRIEVE the CSEBase
 			case ResourceTypes.CSEBase if requestedPermission & Permission.RETRIEVE:
@@ -250,21 +321,23 @@ class SecurityManager(object):
 				if originator == Configuration.cse_registrar_cseID:
 					L.isDebug and L.logDebug(f'Grant registrar CSE Originnator {originator} to RETRIEVE CSEBase. OK.')
 					return True
-				if self.isAllowedOriginator(originator, Configuration.cse_registration_allowedCSROriginators):
+				if self.isAllowedOriginator(originator, self.allowedCSROriginators):
 					L.isDebug and L.logDebug(f'Grant remote CSE Orignator {originator} to RETRIEVE CSEBase. OK.')
 					return True
 
 				# Allow registered AEs to RETRIEVE the CSEBase
-				# This comes last, since it is the most expensive check
-				try:
-					# TODO perhaps have a DB with all originators and their kind?
+				# This comes last, since it is the most expensive check.
+				# It is skipped for originators that are not allowed to register as an AE, so they cannot be a registered AE-ID
+				if self.isAllowedOriginator(originator, self.allowedAEOriginators):
+					try:
+						# TODO perhaps have a DB with all originators and their kind?
 
-					# TODO add a "raw" attribute that returns the JSON, but doesn't intantiate the object
-					if CSE.storage.retrieveResource(aei = originator):
-						L.isDebug and L.logDebug(f'Grant registered AE Orignator {originator} to RETRIEVE CSEBase. OK.')
-						return True
-				except NOT_FOUND:
-					pass # NOT Found is expected
+						# TODO add a "raw" attribute that returns the JSON, but doesn't intantiate the object
+						if CSE.storage.retrieveResource(aei = originator):
+							L.isDebug and L.logDebug(f'Grant registered AE Orignator {originator} to RETRIEVE CSEBase. OK.')
+							return True
+					except NOT_FOUND:
+						pass # NOT Found is expected
 			
 				# Fall-through to further checks
 
@@ -292,7 +365,7 @@ class SecurityManager(object):
 
 					# Check ALL acp
 					for acpRi in macp:
-						acpResult = _checkACPI(originator, acpRi, requestedPermission, ty)
+						acpResult = self._checkACPI(originator, acpRi, requestedPermission, ty)
 						allAcpAttributes.extend(acpResult.attributes)
 						allowed = allowed or acpResult.allowed	# OR all results together
 					if allowed:
@@ -303,7 +376,7 @@ class SecurityManager(object):
 				
 			# target is an ACP or ACPAnnc resource
 			case ResourceTypes.ACP | ResourceTypes.ACPAnnc:
-				if self.checkACPSelfPermission(cast(ACP, resource), originator, requestedPermission):
+				if self.checkACPSelfPermission(resource, originator, requestedPermission):	# type: ignore [arg-type]
 					L.isDebug and L.logDebug('Self-Permission granted')
 					return True
 
@@ -329,7 +402,7 @@ class SecurityManager(object):
 			L.isDebug and L.logDebug('Handle with missing acpi in resource')
 
 			# if the resource *may* have an acpi but doesn't have one set
-			if resource._attributes and 'acpi' in resource._attributes:
+			if (attributes := resource._attributes) and 'acpi' in attributes:
 
 				# Check custodian attribute
 				if custodian := resource.cstn:
@@ -373,7 +446,7 @@ class SecurityManager(object):
 		# Check all ACPs and get also the optional accessControlAttributes
 		allAcpAttributes = []
 		for acpRi in acpi:
-			if (acpResult := _checkACPI(originator, acpRi, requestedPermission, ty)).allowed:
+			if (acpResult := self._checkACPI(originator, acpRi, requestedPermission, ty)).allowed:
 				return True
 			# not general grant, but we may need to check further
 			allAcpAttributes.extend(acpResult.attributes)
@@ -449,6 +522,41 @@ class SecurityManager(object):
 		return False
 
 
+	def _checkACPI(self, originator:str, acpRi:str, requestedPermission:Permission, ty:ResourceTypes) -> ACPResult:
+		""" Check the access control policy for a single ACP resource.
+
+			Args:
+				originator: The originator to check for.
+				acpRi: The resourceID of the ACP resource.
+				requestedPermission: The permission to check.
+				ty: The resource type to check for.
+
+			Return:
+				A data structure with the result of the check.
+
+		"""
+		try:
+			if not (acp := self._retrieveACP(acpRi)):	# resource could be on another CSE
+				L.isDebug and L.logDebug(f'ACP resource not found: {acpRi}')
+				return ACPResult(False, [])
+			
+			# Skip the rule scan if none of the ACP's rules grants the requested permission at all
+			if not requestedPermission & acp.getAcopUnion('pv'):
+				return ACPResult(False, [])
+
+			# check general operation permission. This also returns the attributes (if any)
+			result = self.checkSingleACPPermission(acp, originator, requestedPermission, ty)	# type: ignore [arg-type]
+			if result.allowed:
+				return result
+			if result.attributes:
+				# L.isDebug and L.logDebug(f'Attributes to check further attributes {result.attributes}')
+				return result
+		except ResponseException as e:
+			L.isDebug and L.logDebug(f'ACP resource not found: {acpRi}: {e.dbg}')
+			return ACPResult(False, [])
+		return ACPResult(False, [])
+
+
 	def checkAcpiUpdatePermission(self, request:CSERequest, targetResource:Resource, originator:str) -> bool:
 		"""	Check whether this is actually a correct update of the acpi attribute, and whether this is actually allowed.
 
@@ -464,7 +572,7 @@ class SecurityManager(object):
 				`BAD_REQUEST`: If the *acpi* attribute is not the only attribute in an UPDATE request.
 				`ORIGINATOR_HAS_NO_PRIVILEGE`: If the originator has no access.
 		"""
-		updatedAttributes = findXPath(request.pc, '{*}')	# Get the attributes under the resource element
+		updatedAttributes = next(iter(request.pc.values())) if request.pc else {}	# Get the attributes under the resource element
 
 		# Check that acpi, if present, is the only attribute
 		if 'acpi' in updatedAttributes:
@@ -473,19 +581,19 @@ class SecurityManager(object):
 			
 			# Check whether the originator has UPDATE privileges for the acpi attribute (pvs!)
 			_originator = getIdFromOriginator(originator)
-			if not targetResource.acpi:
+			if not (acpi := targetResource.acpi):
 				if _originator != targetResource.getOriginator():
 					raise ORIGINATOR_HAS_NO_PRIVILEGE(L.logDebug(f'No access to update acpi for originator: {originator}'))
 				else:
 					pass	# allowed for creating originator
 			else:
 				# test the current acpi whether the originator is allowed to update the acpi
-				for acpRi in targetResource.acpi:
+				for acpRi in acpi:
 					try:
-						if not (acp := CSE.dispatcher.retrieveResource(acpRi)):
+						if not (acp := self._retrieveACP(acpRi)):
 							L.isWarn and L.logWarn(f'Access Check for acpi: referenced <ACP> resource not found: {acpRi}')
 							continue
-						if self.checkACPSelfPermission(cast(ACP, acp), _originator, Permission.UPDATE):
+						if self.checkACPSelfPermission(acp, _originator, Permission.UPDATE):	# type: ignore [arg-type]
 							break	# granted
 					except ResponseException as e:
 						L.isWarn and L.logWarn(f'Access Check for acpi: referenced <ACP> resource not found: {acpRi}: {e.dbg}')
@@ -498,7 +606,7 @@ class SecurityManager(object):
 
 
 
-	def checkSingleACPPermission(self, acp:ACP, 
+	def checkSingleACPPermission(self, acp:ACP|ACPAnnc, 
 							  		   originator:str, 
 									   requestedPermission:Permission, 
 									   ty:ResourceTypes,
@@ -520,15 +628,12 @@ class SecurityManager(object):
 
 		# Get through all accessControlRules because we need to collect all attributes
 		# This means we cannot return early
-		# The following loop iterates over the rules of 'pv' or 'pvs'
-		for acr in acp[f'{context}/acr']:
-
-			# Check Permission-to-check first
-			if requestedPermission & acr['acop'] == Permission.NONE:	# permission not fitting at all
-				continue
+		# The following loop iterates over the compiled rules of 'pv' or 'pvs'.
+		# Only the rules that grant the requested permission are returned.
+		for acr in acp.getCompiledRulesForPermission(context, requestedPermission):
 
 			# Check accessControlContexts
-			if (acco := acr.get('acco')) is not None:
+			if (acco := acr.acco) is not None:
 				found = False
 				_ts = utcDatetime()
 				for eachAcco in acco:
@@ -573,35 +678,31 @@ class SecurityManager(object):
 					continue	# Not in any context, so continue with the next acr. Dont check further in this acr
 
 			# Check accessControlAuthenticationFlag
-			if acr.get('acaf') is not None:
+			if acr.acaf:
 				L.isWarn and L.logWarn('AccessControlAuthenticationFlag is not supported yet. Ignoring.')
 				# To support this, we need to check whether the request is authenticated.
 				# See TS-0003, 7.1.2
 			
 
 			# Check accessControlAttributes
-			if (aca := acr.get('aca')) is not None:
+			if (aca := acr.aca) is not None:
 				allAttributes.extend(aca)
 
 			# Check accessControlObjectDetails
-			if acod := acr.get('acod'):
-				for eachAcod in acod:
-					# Check type of chty
-					if requestedPermission == Permission.CREATE:
-						if ty is None or ty not in eachAcod.get('chty'):	# ty is an int, chty a list of ints
-							continue										# for CREATE: type not in chty
-					else:
-						if ty is not None and ty != eachAcod.get('ty'):		# ty is an int
-							continue								# any other Permission type: ty not in chty
-					break # found one, so apply the next checks further down
+			if acr.hasAcod:
+				# Check type of chty
+				if requestedPermission == Permission.CREATE:
+					if ty is None or ty not in acr.acodChty:	# ty is an int
+						continue								# for CREATE: type not in any chty, so continue the next acr
 				else:
-					continue	# NOT found, so continue the next acr
+					if ty is not None and ty not in acr.acodTy:	# ty is an int
+						continue								# any other Permission type: ty not in any ty, so continue the next acr
 
 				# TODO support acod/specialization
 
 			# Check originator
 			# If we arrive here, then all the checks have passed, and we can check the originator
-			originatorAllowed = self._checkAcor(acp, acr['acor'], originator)
+			originatorAllowed = self._checkAcor(acr, originator)
 
 			# We can return early if the originator is allowed and we don't have attributes for this
 			# rule. This is ageneral permit for the originator and this operation.
@@ -626,40 +727,25 @@ class SecurityManager(object):
 		# TODO add attribute and other checks
 		# Perhaps move the attribute and other checks to a separate method
 
-		match acp.ty:
-			case ResourceTypes.ACP:
-				for permission in acp['pvs/acr']:
-					if requestedPermission & permission['acop'] == 0:	# permission not fitting at all
-						continue
-
-					# Check originator
-					if self._checkAcor(acp, permission['acor'], originator):
-						return True
-				return False
-
-			case ResourceTypes.ACPAnnc:
-				# Check for self permissions in the ACPAnnc must be done a bit differently because we 
-				# don't have the optimizations that we have in the ACP resource
-				for permission in acp['pvs/acr']:
-					if requestedPermission & permission['acop'] == 0:	# permission not fitting at all
-						continue
-
-					# TODO check acod in pvs
-					if 'all' in permission['acor'] or originator in permission['acor']:
-						return True
-					
-					if any([ simpleMatch(originator, a) for a in permission['acor'] ]):	# check whether there is a wildcard match
-						return True
-				return False
+		# <ACP> and <ACPAnnc> resources both provide compiled rules. Group references are not
+		# resolved for <ACPAnnc> resources, so the same check can be used for both types.
+		if acp.ty not in (ResourceTypes.ACP, ResourceTypes.ACPAnnc):
+			return False
+		if not requestedPermission & acp.getAcopUnion('pvs'):	# no rule grants the permission at all
+			return False
+		for acr in acp.getCompiledRulesForPermission('pvs', requestedPermission):	# only rules that grant the permission
+			# TODO check acod in pvs
+			# Check originator
+			if self._checkAcor(acr, originator):
+				return True
 		return False
 
 
-	def _checkAcor(self, acp:ACP|ACPAnnc, acor:list[str], originator:str) -> bool:
-		""" Check whether an originator is in the list of acor entries.
+	def _checkAcor(self, acr:ACPRule, originator:str) -> bool:
+		""" Check whether an originator is in the acor entries of a compiled accessControlRule.
 		
 			Args:
-				acp: The ACP resource to check.
-				acor: The list of acor entries.
+				acr: The compiled accessControlRule to check.
 				originator: The originator to check.
 				
 			Return:
@@ -667,56 +753,148 @@ class SecurityManager(object):
 		"""
 
 		# Check originator
-		if 'all' in acor or originator in acor:
+		if acr.acorHasAll or originator in acr.acorExact:
 			return True
 		
-		# Iterrate over all acor entries for either a group check or a wildcard check
-		for a in acor:
-
-			# Check for group. If the originator is a member of a group, then the originator has access
-			if acp.getTypeForRI(a) == ResourceTypes.GRP:
-				try:
-					if originator in CSE.dispatcher.retrieveResource(a).mid:
-						L.isDebug and L.logDebug(f'Originator found in group member')
-						return True
-				except ResponseException as e:
-					L.logErr(f'GRP resource not found for ACP check: {a}', exc = e)
-					continue # Not much that we can do here
+		# Check for wildcard match
+		if (wildcards := acr.acorWildcards) is not None and wildcards.fullmatch(originator):
+			return True
 
-			# Otherwise Check for wildcard match
-			if simpleMatch(originator, a):
-				return True
+		# Check for group. If the originator is a member of a group, then the originator has access
+		for a in acr.acorGroups:
+			try:
+				if originator in self._getGrpMids(a):
+					L.isDebug and L.logDebug(f'Originator found in group member')
+					return True
+			except ResponseException as e:
+				L.logErr(f'GRP resource not found for ACP check: {a}', exc = e)
+				continue # Not much that we can do here
 		
 		# No match found
 		return False
 
 
-	def isAllowedOriginator(self, originator:str, allowedOriginators:List[str]) -> bool:
-		""" Check whether an Originator is in the provided list of allowed originators. This list may contain regex.
+	def isAllowedOriginator(self, originator:str, allowedOriginators:Optional[re.Pattern]) -> bool:
+		""" Check whether an Originator matches the provided allowed originators.
 			
 			The hosting CSE has always access.
 
 			Args:
 				originator: The request originator.
-				allowedOriginators: A list of allowed originators, which may include regex.
+				allowedOriginators: The compiled list of allowed originators, e.g. `allowedAEOriginators`. *None* if no originator is allowed.
 			
 			Return:
 				Boolean value indicating the result.
 		"""
-		if not originator or not allowedOriginators:
+		if not originator or allowedOriginators is None:
 			return False
 
-		_originator = getIdFromOriginator(originator)
-		L.isDebug and L.logDebug(f'Originator: {_originator} - allowed originators: {allowedOriginators}')
-		
 		# Always allow for the hosting CSE
-		if originator in [RC.cseCsi, RC.cseSPRelative] :
+		if originator == RC.cseCsi or originator == RC.cseSPRelative:
 			return True
 
-		for ao in allowedOriginators:
-			if simpleMatch(_originator, ao):
-				return True
-		return False
+		_originator = getIdFromOriginator(originator)
+		L.isDebug and L.logDebug(f'Originator: {_originator} - allowed originators: {allowedOriginators}')
+
+		# All allowed originators are checked with a single compiled expression
+		return allowedOriginators.fullmatch(_originator) is not None
+
+
+	def _retrieveACP(self, acpRi:str) -> Resource:
+		"""	Retrieve an <ACP> resource for an *acpi* entry.
+
+			Local <ACP> and <ACPAnnc> resources are cached. The cache entries are removed when the
+			resource is updated or deleted, see `invalidateCachedACP()`. Resources on other CSEs
+			are always retrieved.
+
+			Args:
+				acpRi: The resource ID of the <ACP> resource as found in an *acpi* attribute.
+
+			Return:
+				The <ACP> resource.
+
+			Raises:
+				`ResponseException`: In case the resource cannot be retrieved.
+		"""
+		if localResourceID(acpRi) is None:	# resource is on another CSE
+			return CSE.dispatcher.retrieveResource(acpRi)
+
+		with self._acpCacheLock:
+			if (acp := self._acpCache.get(acpRi)) is not None:
+				return acp
+			version = self._acpCacheVersion
+
+		# Retrieve outside of the lock, so that cache misses of other requests are not blocked
+		acp = CSE.dispatcher.retrieveResource(acpRi)
+		if acp and acp.ty in (ResourceTypes.ACP, ResourceTypes.ACPAnnc):
+			with self._acpCacheLock:
+				if version == self._acpCacheVersion:	# don't add the resource if an invalidation happened in the meantime
+					if len(self._acpCache) >= self._acpCacheSize:
+						oldestKey = next(iter(self._acpCache))	# remove the oldest entry
+						oldestRi = self._acpCache.pop(oldestKey).ri
+						if (keys := self._acpCacheKeys.get(oldestRi)) is not None:
+							keys.discard(oldestKey)
+							if not keys:
+								del self._acpCacheKeys[oldestRi]
+					self._acpCache[acpRi] = acp
+					self._acpCacheKeys.setdefault(acp.ri, set()).add(acpRi)
+		return acp
+
+
+	def invalidateCachedACP(self, ri:str) -> None:
+		"""	Remove an <ACP> or <ACPAnnc> resource from the ACP cache.
+
+			This must be called whenever such a resource is updated or deleted.
+
+			Args:
+				ri: The resource ID of the <ACP> or <ACPAnnc> resource.
+		"""
+		with self._acpCacheLock:
+			self._acpCacheVersion += 1
+			for key in self._acpCacheKeys.pop(ri, ()):	# the same resource may be cached for an ri and a srn
+				self._acpCache.pop(key, None)
+
+
+	def _getGrpMids(self, grpRi:str) -> frozenset[str]:
+		"""	Get the member IDs of a <GRP> resource that is referenced in an *acor* entry.
+
+			The member IDs of local <GRP> resources are cached. The cache entries are removed when the <GRP> resource
+			is updated or deleted, see `invalidateCachedGroup()`. Resources on other CSEs are always retrieved.
+
+			Args:
+				grpRi: The resource ID of the <GRP> resource as found in an *acor* attribute.
+
+			Return:
+				Set of member IDs.
+
+			Raises:
+				`ResponseException`: In case the resource cannot be retrieved.
+		"""
+		if localResourceID(grpRi) is None:	# resource is on another CSE
+			return frozenset(CSE.dispatcher.retrieveResource(grpRi).mid or [])
+
+		# Retrieve and add under the lock, so that an invalidation cannot be overtaken by an older version
+		with self._grpMidCacheLock:
+			if (entry := self._grpMidCache.get(grpRi)) is None:
+				grp = CSE.dispatcher.retrieveResource(grpRi)
+				entry = (grp.ri, frozenset(map(intern, grp.mid or [])))
+				if len(self._grpMidCache) >= self._grpMidCacheSize:
+					del self._grpMidCache[next(iter(self._grpMidCache))]	# remove the oldest entry
+				self._grpMidCache[grpRi] = entry
+			return entry[1]
+
+
+	def invalidateCachedGroup(self, ri:str) -> None:
+		"""	Remove the members of a <GRP> resource from the group membership cache.
+
+			This must be called whenever a <GRP> resource is updated or deleted.
+
+			Args:
+				ri: The resource ID of the <GRP> resource.
+		"""
+		with self._grpMidCacheLock:
+			for key in [ k for k, (grpRi, _) in self._grpMidCache.items() if grpRi == ri ]:	# the same resource may be cached for an ri and a srn
+				del self._grpMidCache[key]
 
 
 	def hasAccessToPollingChannel(self, originator:str, resource:PCH|PCH_PCU) -> bool:
@@ -750,12 +928,7 @@ class SecurityManager(object):
 		context = None
 		if useTLS:
 			L.isDebug and L.logDebug(f'Certfile: {caCertificateFile}, KeyFile:{caPrivateKeyFile}, TLS version: {tlsVersion}')
-			context = ssl.SSLContext(
-							{ 	'tls1.1' : ssl.PROTOCOL_TLSv1_1,
-								'tls1.2' : ssl.PROTOCOL_TLSv1_2,
-								'auto'   : ssl.PROTOCOL_TLS,			# since Python 3.6. Automatically choose the highest protocol version between client & server
-							}[tlsVersion.lower()]
-						)
+			context = ssl.SSLContext(_tlsVersions[tlsVersion.lower()])
 			context.load_cert_chain(caCertificateFile, caPrivateKeyFile)
 			context.verify_mode = ssl.CERT_REQUIRED if verifyCertificate else ssl.CERT_NONE
 		return context
@@ -764,53 +937,62 @@ class SecurityManager(object):
 	def getSSLContextHttp(self) -> ssl.SSLContext:
 		"""	Depending on the configuration whether to use TLS, this method creates a new *SSLContext*
 			from the configured certificates and returns it. If TLS is disabled then *None* is returned.
+			The context is created only once and then re-used until a security setting changes.
 
 			This method is used for HTTP connections.
 
 			Return:
 				SSL / TLD context.
 		"""
-		L.isDebug and L.logDebug(f'Setup HTTPS SSL context.')
-		return self._getContext(Configuration.http_security_useTLS, 
-						  		Configuration.http_security_verifyCertificate, 
-								Configuration.http_security_tlsVersion, 
-								Configuration.http_security_caCertificateFile,
-								Configuration.http_security_caPrivateKeyFile)	# type: ignore
+		if (context := self._sslContexts.get('http')) is None:
+			L.isDebug and L.logDebug(f'Setup HTTPS SSL context.')
+			context = self._sslContexts['http'] = self._getContext(Configuration.http_security_useTLS, 
+																	Configuration.http_security_verifyCertificate, 
+																	Configuration.http_security_tlsVersion, 
+																	Configuration.http_security_caCertificateFile,
+																	Configuration.http_security_caPrivateKeyFile)	# type: ignore
+		return context
 
 
 	def getSSLContextCoAP(self) -> ssl.SSLContext:
 		"""	Depending on the configuration whether to use DTLS, this method creates a new *SSLContext*
 			from the configured certificates and returns it. If TLS is disabled then *None* is returned.
+			The context is created only once and then re-used until a security setting changes.
 
 			This method is used for CoAP connections.
 
 			Return:
 				SSL / TLD context.
 		"""
-		L.isDebug and L.logDebug(f'Setup CoAP SSL context.')
-		return self._getContext(Configuration.coap_security_useDTLS, 
-						  		Configuration.coap_security_verifyCertificate, 
-								Configuration.coap_security_dtlsVersion, 
-								Configuration.coap_security_caCertificateFile,
-								Configuration.coap_security_caPrivateKeyFile)	# type: ignore
+		if (context := self._sslContexts.get('coap')) is None:
+			L.isDebug and L.logDebug(f'Setup CoAP SSL context.')
+			context = self._sslContexts['coap'] = self._getContext(Configuration.coap_security_useDTLS, 
+																	Configuration.coap_security_verifyCertificate, 
+																	Configuration.coap_security_dtlsVersion, 
+																	Configuration.coap_security_caCertificateFile,
+																	Configuration.coap_security_caPrivateKeyFile)	# type: ignore
+		return context
 
 
 
 	def getSSLContextWs(self) -> ssl.SSLContext:
 		"""	Depending on the configuration whether to use TLS, this method creates a new *SSLContext*
 			from the configured certificates and returns it. If TLS is disabled then *None* is returned.
+			The context is created only once and then re-used until a security setting changes.
 
 			This method is used for WebSocket connections.
 
 			Return:
 				SSL / TLD context.
 		"""
-		L.isDebug and L.logDebug(f'Setup WSS SSL context.')
-		return self._getContext(Configuration.websocket_security_useTLS,
-						  		Configuration.websocket_security_verifyCertificate,
-								Configuration.websocket_security_tlsVersion,
-								Configuration.websocket_security_caCertificateFile,
-								Configuration.websocket_security_caPrivateKeyFile)
+		if (context := self._sslContexts.get('websocket')) is None:
+			L.isDebug and L.logDebug(f'Setup WSS SSL context.')
+			context = self._sslContexts['websocket'] = self._getContext(Configuration.websocket_security_useTLS,
+																		 Configuration.websocket_security_verifyCertificate,
+																		 Configuration.websocket_security_tlsVersion,
+																		 Configuration.websocket_security_caCertificateFile,
+																		 Configuration.websocket_security_caPrivateKeyFile)
+		return context
 
 
 	##########################################################################
@@ -859,19 +1041,19 @@ class SecurityManager(object):
 							continue
 						if len(line.strip()) == 0:
 							continue
-						(username, password) = line.strip().split(':')
+						username, _, password = line.strip().partition(':')	# passwords may contain ':'
 						self.httpBasicAuthData[username] = password.strip()
 			except Exception as e:
 				L.logErr(f'Error reading basic authentication file: {e}')
 
 
 	def _readHttpTokenAuthFile(self) -> None:
-		"""	Read the HTTP token authentication file and store the data in a dictionary.
+		"""	Read the HTTP token authentication file and store the data in a set.
 			The authentication information is stored as a single token per line.
 
-			The data is stored in the `httpTokenAuthData` list.
+			The data is stored in the `httpTokenAuthData` frozenset.
 		"""
-		self.httpTokenAuthData = []
+		tokens:list[str] = []
 		# We need to access the configuration directly, since the http server is not yet initialized
 		if Configuration.http_security_enableTokenAuth and Configuration.http_security_tokenAuthFile:
 			try:
@@ -881,6 +1063,7 @@ class SecurityManager(object):
 							continue
 						if len(line.strip()) == 0:
 							continue
-						self.httpTokenAuthData.append(line.strip())
+						tokens.append(line.strip())
 			except Exception as e:
 				L.logErr(f'Error reading token authentication file: {e}')
+		self.httpTokenAuthData = frozenset(tokens)
@@ -9,21 +9,54 @@
 """
 
 from __future__ import annotations
-from typing import Sequence, cast, Optional, Union, List
+from typing import Sequence, Iterable, cast, Optional, Union, List
 
 import sys
+from operator import attrgetter
 from abc import ABC, abstractmethod
+from threading import Lock
 from xml.etree import ElementTree
 import base64, binascii
 
 from ..resources.SMD import SMD
 from ..resources.Resource import Resource
 from ..runtime import CSE
+from ..helpers.BackgroundWorker import BackgroundWorkerPool
 from ..etc.Types import Permission, ResourceTypes, Result, SemanticFormat, ContentSerializationType
 from ..etc.ResponseStatusCodes import BAD_REQUEST, ResponseException, INTERNAL_SERVER_ERROR
 from ..runtime.Logging import Logging as L
 
 
+if sys.version_info >= (3, 11):
+	def _b64decode(data:Union[str, bytes]) -> bytes:
+		"""	Strictly decode a base64 encoded string. The validation is done by *binascii* during the decoding.
+
+			Args:
+				data: The base64 encoded string.
+
+			Return:
+				The decoded bytes.
+
+			Raises:
+				`binascii.Error`: In case the input is not valid base64.
+		"""
+		return binascii.a2b_base64(data, strict_mode = True)	# type: ignore [call-arg]
+else:
+	def _b64decode(data:Union[str, bytes]) -> bytes:
+		"""	Strictly decode a base64 encoded string with the *base64* module's validating decoder.
+
+			Args:
+				data: The base64 encoded string.
+
+			Return:
+				The decoded bytes.
+
+			Raises:
+				`binascii.Error`: In case the input is not valid base64.
+		"""
+		return base64.b64decode(data, validate = True)
+
+
 class SemanticHandler(ABC):
 	"""	Abstract base class for semantic graph store handlers.
 	"""
@@ -57,6 +90,16 @@ class SemanticHandler(ABC):
 		...
 
 
+	@abstractmethod
+	def addDescriptions(self, descriptions:Sequence[tuple[str, SemanticFormat, str, str, bool]]) -> None:
+		"""	Add multiple semantic descriptions, together with their parent IDs, to the graph store in one batch.
+		
+			Args:
+				descriptions: A sequence of tuples (description, format, id, parent ID, strict). If *strict* is True then an invalid description raises an exception, otherwise the error is ignored and the parent ID is added anyway.
+		"""
+		...
+
+
 	@abstractmethod
 	def addParentID(self, id:str, pi:str) -> None:
 		"""	Add the parent ID to a resource's graph.
@@ -96,12 +139,12 @@ class SemanticHandler(ABC):
 
 
 	@abstractmethod
-	def query(self, query:str, ids:Sequence[str], format:str) -> Result:
+	def query(self, query:str, ids:Iterable[str], format:str) -> Result:
 		"""	Run a SPARQL query against a graph.
 
 			Args:
 				query: SPARQL query.
-				ids: List of resource / graph identifiers used to build the graph for the query.
+				ids: Resource / graph identifiers used to build the graph for the query.
 				format: Desired serialization format for the result. It must be supported.
 
 			Return:
@@ -146,8 +189,10 @@ class SemanticManager(object):
 		self.defaultFormat = SemanticFormat.FF_RdfXml	# TODO configurable
 
 		# Re-Build graph in memory from <SMD> resources.
-		for smd in cast(Sequence[SMD], CSE.dispatcher.retrieveResourcesByType(ResourceTypes.SMD)):
-			self.addDescriptor(smd)
+		self.addDescriptors(cast(Sequence[SMD], CSE.dispatcher.retrieveResourcesByType(ResourceTypes.SMD)))
+
+		# Prepare the query engine in the background, so that the first query doesn't have to wait for it
+		BackgroundWorkerPool.runJob(RdfLibHandler.prepareQueryEngine, 'semanticQueryEngine')
 
 		# Add a handler when the CSE is reset
 		CSE.event.addHandler(CSE.event.cseReset, self.restart)	# type: ignore
@@ -198,9 +243,11 @@ class SemanticManager(object):
 			raise BAD_REQUEST(L.logDebug('IRI presentation format is currently not supported (only RDF/XML, JSON-LD, Turtle)'))
 		try:
 			# Also store the decoded B64 string in the resource
-			smd.setDecodedDSP(_desc := base64.b64decode(smd.dsp, validate = True).decode('UTF-8').strip())
+			smd.setDecodedDSP(_desc := _b64decode(smd.dsp).decode('UTF-8').strip())
 		except binascii.Error as e:
 			raise BAD_REQUEST(L.logDebug(f'Invalid base64-encoded descriptor: {str(e)}'))
+		except UnicodeDecodeError as e:
+			raise BAD_REQUEST(L.logDebug(f'Descriptor is not UTF-8 encoded: {str(e)}'))
 
 		self.semanticHandler.validateDescription(_desc, smd.dcrp)
 
@@ -289,6 +336,18 @@ class SemanticManager(object):
 		# 	referenced ontology. If any problem occurs, the Hosting CSE shall generate a Response Status Code indicating an "INVALID_SEMANTICS" error.
 
 
+	def addDescriptors(self, smds:Sequence[SMD]) -> None:
+		"""	Add the descriptors of multiple <`SMD`> resources in one batch, e.g. when re-building the graph store.
+
+			Args:
+				smds: `SMD` resources to add.
+		"""
+		if not smds:
+			return
+		L.isDebug and L.logDebug(f'Adding descriptors for {len(smds)} <SMD> resources')
+		self.semanticHandler.addDescriptions([ (smd.getDecodeDSP(), smd.dcrp, smd.ri, smd.pi, bool(smd.vlde)) for smd in smds ])
+
+
 	def updateDescriptor(self, smd:SMD) -> None:
 		"""	Update the graph for a semantic descriptor.
 			
@@ -350,7 +409,7 @@ class SemanticManager(object):
 			smds = [ smds ]
 
 		return self.semanticHandler.query(query, 
-										  [ smd.ri for smd in smds ], 
+										  map(attrgetter('ri'), smds), 
 										  serializationFormat)
 		# aggregatedGraph = self.semanticHandler.getAggregatedGraph([ smd.ri for smd in smds ])
 		# qres = self.semanticHandler.query(query, aggregatedGraph).data
@@ -444,7 +503,16 @@ class SemanticManager(object):
 
 import rdflib
 from rdflib.plugins.stores.memory import Memory
-from rdflib.term import URIRef
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.term import URIRef, IdentifiedNode
+from functools import lru_cache
+from ..helpers.ACMELRUCache import ACMELRUCache
+
+
+_uri = lru_cache(maxsize = 4096)(URIRef)
+"""	Return a cached *URIRef* for a graph identifier. Creating a *URIRef* validates the string, and the
+	identifiers of the <SMD> resources are used over and over again.
+"""
 
 
 class RdfLibHandler(SemanticHandler):
@@ -461,6 +529,11 @@ class RdfLibHandler(SemanticHandler):
 	__slots__ = (
 		'store',
 		'graph',
+		'_validatedGraphs',
+		'_validatedGraphsLock',
+		'_queryCache',
+		'_queryCacheLock',
+		'_queryCacheVersion',
 	)
 
 	supportedFormats =	{ SemanticFormat.FF_RdfXml		: 'xml',
@@ -474,6 +547,12 @@ class RdfLibHandler(SemanticHandler):
 	storeIdentifier =	'acme'
 	"""	The identifier for the graph stores."""
 
+	validatedGraphsSize = 16
+	"""	Maximum number of parsed graphs that are kept from validations to be added to the store later. """
+
+	queryCacheSize = 256
+	"""	Maximum number of serialized query results that are cached. """
+
 
 	def __init__(self) -> None:
 		"""	Initializer for the RdfLibHandler class.
@@ -485,6 +564,15 @@ class RdfLibHandler(SemanticHandler):
 		self._openStore()
 
 		self.graph = rdflib.Dataset(store = self.store)		# type:ignore [no-untyped-call]
+
+		# Graphs that were parsed during a validation, indexed by format and description
+		self._validatedGraphs:dict[tuple[str, str], rdflib.Graph] = {}
+		self._validatedGraphsLock = Lock()
+
+		# Serialized query results, indexed by query, graph IDs and format. The cache is cleared when any graph changes
+		self._queryCache:ACMELRUCache = ACMELRUCache(maxsize = self.queryCacheSize)
+		self._queryCacheLock = Lock()
+		self._queryCacheVersion = 0	# incremented when the cache is cleared
 	
 
 	#
@@ -492,32 +580,42 @@ class RdfLibHandler(SemanticHandler):
 	#
 
 	def validateDescription(self, description:str, format:SemanticFormat) -> None:
-		if not (_format := self.getFormat(format)):
+		if not (_format := self.supportedFormats.get(format)):
 			raise BAD_REQUEST(L.logWarn(f'Unsupported format: {format} for semantic descriptor'))
 
-		# Parse once to validate, but throw away the result
+		# Parse once to validate, and keep the result for adding the description later
 		try:
-			rdflib.Graph().parse(data = description, format = _format)
+			parsedGraph = rdflib.Graph().parse(data = description, format = _format)
 		except Exception as e:
 			raise BAD_REQUEST(L.logWarn(f'Invalid descriptor: {str(e)}'))
+		with self._validatedGraphsLock:
+			if len(self._validatedGraphs) >= self.validatedGraphsSize:
+				del self._validatedGraphs[next(iter(self._validatedGraphs))]	# remove the oldest entry
+			self._validatedGraphs[(_format, description)] = parsedGraph
 	
 
 	def addDescription(self, description:str, format:SemanticFormat, id:str) -> None:
-		if not (_format := self.getFormat(format)):
-			raise BAD_REQUEST(L.logWarn(f'Unsupported format: {format} for semantic descriptor'))
-		
-		# Parse into its own graph
-		try:
-			g = rdflib.Graph(store = self.store, identifier = id)
-			g.parse(data = description, format = _format)
-		except Exception as e:
-			L.logErr('', exc = e)
-			raise BAD_REQUEST(L.logWarn(f'Invalid descriptor: {str(e)}'))
+		self._clearQueryCache()
+		self._addGraph(description, format, id)
+
+
+	def addDescriptions(self, descriptions:Sequence[tuple[str, SemanticFormat, str, str, bool]]) -> None:
+		# The Memory store doesn't support transactions, so just clear the cache only once and add all graphs
+		self._clearQueryCache()
+		addGraph = self._addGraph
+		addParent = self._addParentID
+		for description, format, id, pi, strict in descriptions:
+			try:
+				addGraph(description, format, id)
+			except ResponseException as e:
+				if strict:
+					raise e
+			addParent(id, pi)
 	
 
 	def addParentID(self, id: str, pi: str) -> None:
-		graph = self.graph.get_graph(URIRef(id))
-		graph.add( (rdflib.Literal('m2m:resource'), rdflib.Literal('m2m:isChildOf'), rdflib.Literal(pi)) )
+		self._clearQueryCache()
+		self._addParentID(id, pi)
 
 
 	def updateDescription(self, description:str, format:SemanticFormat, id: str) -> None:
@@ -526,6 +624,7 @@ class RdfLibHandler(SemanticHandler):
 		
 		
 	def removeDescription(self, id:str) -> None:
+		self._clearQueryCache()
 		graph = self.getGraph(id)
 
 		# Remove the triples from the graph
@@ -537,32 +636,48 @@ class RdfLibHandler(SemanticHandler):
 		self.store.remove_graph(graph)		# type:ignore [no-untyped-call]
 
 
-	def query(self, query:str, ids:Sequence[str], format:str) -> Result:
+	def query(self, query:str, ids:Iterable[str], format:str) -> Result:
 		L.isDebug and L.logDebug(f'Querying graphs')
+		ids = tuple(ids)	# materialize only once, it is also used as part of the cache key
 
 		# Check serialization format
 		if not format in ( 'json', 'xml', 'csv', 'txt' ):
 			raise BAD_REQUEST(L.logWarn(f'Unsupported result serialization format: {format}'))
 
+		# Return a cached result for the same query against the same graphs
+		key = (query, ids, format)
+		with self._queryCacheLock:
+			result = self._queryCache.get(key)
+			version = self._queryCacheVersion
+		if result is not None:
+			L.isDebug and L.logDebug('Returning cached query result')
+			return Result(data = result)
+
 		# Aggregate a new graph for the query
 		aggregatedGraph = self.getAggregatedGraph(ids)
 
 		# Query the graph
+		result = None
 		try:
 			qres = aggregatedGraph.query(query) # type: ignore
 
-			# Pretty print the result to the log
+			# Pretty print the result to the log. The serialized result is kept to be returned later
 			# ET.indent is only available in Python 3.9+
 			if L.isDebug and sys.version_info >= (3, 9) and format == 'xml':
-				element = ElementTree.XML(qres.serialize(format = format).decode('UTF-8'))
+				element = ElementTree.XML(result := qres.serialize(format = format).decode('UTF-8'))
 				ElementTree.indent(element)	# type:ignore
 				L.logDebug(ElementTree.tostring(element, encoding = 'unicode'))
 		except Exception as e:
 			raise BAD_REQUEST(L.logWarn(f'Query error: {str(e)} for result'))
 
 
-		# Serialize the result in the desired format and return
-		return Result(data = qres.serialize(format = format).decode('UTF-8'))
+		# Serialize the result in the desired format (if not done already), cache and return it
+		if result is None:
+			result = qres.serialize(format = format).decode('UTF-8')
+		with self._queryCacheLock:
+			if version == self._queryCacheVersion:	# don't cache the result if a graph was changed in the meantime
+				self._queryCache[key] = result
+		return Result(data = result)
 
 
 	def reset(self) -> None:
@@ -570,11 +685,74 @@ class RdfLibHandler(SemanticHandler):
 		self.store.close()								# type:ignore [no-untyped-call]
 		self.store.destroy(self.storeIdentifier)		# type:ignore [no-untyped-call]
 		self._openStore()
+		with self._validatedGraphsLock:
+			self._validatedGraphs.clear()
+		self._clearQueryCache()
+		_uri.cache_clear()
 
 	#
 	#	Handler-internal methods
 	#
 
+	@staticmethod
+	def prepareQueryEngine() -> None:
+		"""	Prepare rdflib's SPARQL query engine by parsing a simple query. 
+		
+			The query parser is initialized when it is used for the first time, which may take some time.
+		"""
+		try:
+			prepareQuery('SELECT ?s WHERE { ?s ?p ?o }')
+			L.isDebug and L.logDebug('SPARQL query engine prepared')
+		except Exception as e:
+			L.logErr('Error preparing the SPARQL query engine', exc = e)
+
+
+	def _addGraph(self, description:str, format:SemanticFormat, id:str) -> None:
+		"""	Parse a semantic description into its own graph in the store. The query cache is not cleared.
+
+			Args:
+				description: A string with the semantic description.
+				format: The format of the string in *description*.
+				id: Identifier for the graph.
+		"""
+		if not (_format := self.supportedFormats.get(format)):
+			raise BAD_REQUEST(L.logWarn(f'Unsupported format: {format} for semantic descriptor'))
+		
+		# Parse into its own graph, or copy the triples if the description has been parsed already during its validation.
+		# The parsed graph is removed, because it is not needed anymore
+		try:
+			g = rdflib.Graph(store = self.store, identifier = id)
+			with self._validatedGraphsLock:
+				parsedGraph = self._validatedGraphs.pop((_format, description), None)
+			if parsedGraph is not None:
+				g += parsedGraph
+			else:
+				g.parse(data = description, format = _format)
+		except Exception as e:
+			L.logErr('', exc = e)
+			raise BAD_REQUEST(L.logWarn(f'Invalid descriptor: {str(e)}'))
+
+
+	def _addParentID(self, id:str, pi:str) -> None:
+		"""	Add the parent ID to a graph. The query cache is not cleared.
+
+			Args:
+				id: Identifier for the graph.
+				pi: Parent ID to add.
+		"""
+		# Add to a graph view on the store directly. Looking up the graph would walk all graphs in the store
+		graph = rdflib.Graph(store = self.store, identifier = _uri(id))
+		graph.add( (rdflib.Literal('m2m:resource'), rdflib.Literal('m2m:isChildOf'), rdflib.Literal(pi)) )
+
+
+	def _clearQueryCache(self) -> None:
+		"""	Remove all cached query results. This must be called whenever a graph changes.
+		"""
+		with self._queryCacheLock:
+			self._queryCache.clear()
+			self._queryCacheVersion += 1
+
+
 	def getFormat(self, format:SemanticFormat) -> Optional[str]:
 		"""	Return a representation of a semantic format supported by the graph framework.
 
@@ -594,7 +772,7 @@ class RdfLibHandler(SemanticHandler):
 			Return:
 				A *Graph* object, or None.
 		"""
-		return self.graph.get_graph(URIRef(id))
+		return self.graph.get_graph(_uri(id))
 
 
 	def getAggregatedGraph(self, ids:Sequence[str]) -> Optional[rdflib.Dataset]:
@@ -610,11 +788,18 @@ class RdfLibHandler(SemanticHandler):
 		L.isDebug and L.logDebug(f'Aggregating graphs for ids: {ids}')
 		# create a common store for the aggregation
 		dataset = rdflib.Dataset(store = Memory())		# type:ignore [no-untyped-call]
-		for id in ids:
-			if not (g := self.getGraph(id)):
+
+		# Find all graphs in a single walk over the store's contexts. Looking up each graph
+		# separately would walk over all contexts for every id.
+		graphs:dict[IdentifiedNode, Optional[rdflib.Graph]] = { _uri(id):None for id in ids }
+		for g in self.graph.contexts():
+			if g.identifier in graphs:
+				graphs[g.identifier] = g
+		for id, g in graphs.items():
+			if not g:
 				L.logErr(f'Graph for id: {id} not found')
 				return None
-			[ dataset.add(_g) for _g in g ]
+			dataset.addN((_s, _p, _o, dataset.default_context) for _s, _p, _o in g)	# bulk-add the triples to the default graph
 				
 		#L.logDebug(dataset.serialize(format='xml'))
 		return dataset		
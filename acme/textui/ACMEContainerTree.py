@@ -7,23 +7,27 @@
 """	This module defines the *Resources* view for the ACME text UI.
 """
 from __future__ import annotations
-from typing import List, Tuple, Optional, Any, cast
+from typing import List, Tuple, Optional, Sequence, Any, cast
 
-import json
+import json, asyncio
+from operator import itemgetter
+from functools import partial
 
-from textual import events
+from textual import events, work
 from textual.app import ComposeResult
 from textual.widgets import Tree as TextualTree, Static, TabbedContent, TabPane, Label, Button
 from textual.widgets.tree import TreeNode
 from textual.containers import Container, Vertical, Horizontal
 from textual.screen import ModalScreen
 from textual.binding import Binding
+from textual.timer import Timer
 from rich.syntax import Syntax
 from ..runtime import CSE
 from ..resources.Resource import Resource
 from ..textui.ACMEContainerRequests import ACMEViewRequests
 from ..etc.ResponseStatusCodes import ResponseException
-from ..etc.Types import ResourceTypes
+from ..etc.Types import ResourceTypes, JSON
+from ..helpers.ACMELRUCache import ACMELRUCache
 from ..etc.Constants import RuntimeConstants as RC
 from ..helpers.TextTools import commentJson, limitLines
 from .ACMEContainerCreate import ACMEContainerCreate
@@ -33,14 +37,56 @@ from .ACMEContainerDiagram import ACMEContainerDiagram
 from .ACMEContainerResourceServices import ACMEContainerResourceServices
 
 
+_hiddenResourceTypes = frozenset(( ResourceTypes.GRP_FOPT, ResourceTypes.PCH_PCU ))
+"""	Resource types that are not shown in the resource tree. """
+
+_diagramTrueValues = frozenset(( 'true', 'on', 'yes', 'high' ))
+"""	Lower-case instance contents that are shown as 1 in a diagram. """
+
+_diagramFalseValues = frozenset(( 'false', 'off', 'no', 'low' ))
+"""	Lower-case instance contents that are shown as 0 in a diagram. """
+
+_tabsInstance = (( 'tree-tab-services', 'tree-tab-create', 'tree-tab-delete' ), 
+				 ( 'tree-tab-diagram', 'tree-tab-update' ))
+_tabsContainer = (( 'tree-tab-services', 'tree-tab-diagram', 'tree-tab-create', 'tree-tab-delete', 'tree-tab-update' ), 
+				  ())
+_tabsVisibility:dict[ResourceTypes, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+	# Don't allow to send UPDATE or DELETE requests to the CSE resource
+	ResourceTypes.CSEBase:	(( 'tree-tab-services', ), 
+							 ( 'tree-tab-update', 'tree-tab-delete', 'tree-tab-diagram' )),
+	ResourceTypes.CNT:		_tabsContainer,
+	ResourceTypes.TS:		_tabsContainer,
+	ResourceTypes.CIN:		_tabsInstance,
+	ResourceTypes.TSI:		_tabsInstance,
+	ResourceTypes.FCI:		_tabsInstance,
+	ResourceTypes.CNT_LA:	_tabsInstance,
+	ResourceTypes.CNT_OL:	_tabsInstance,
+	ResourceTypes.FCNT_LA:	_tabsInstance,
+	ResourceTypes.FCNT_OL:	_tabsInstance,
+	ResourceTypes.TS_LA:	_tabsInstance,
+	ResourceTypes.TS_OL:	_tabsInstance,
+}
+"""	The tabs to show and to hide for a resource type in the resource view. Tabs that are not listed keep their visibility. """
+
+_tabsVisibilityDefault = (( 'tree-tab-services', 'tree-tab-create', 'tree-tab-update', 'tree-tab-delete' ), 
+						  ( 'tree-tab-diagram', ))
+"""	The tabs to show and to hide for all other resource types. """
+
 
 class ACMEResourceTree(TextualTree):
 
+	highlightDelay = 0.1
+	"""	Delay in seconds before the content of a highlighted node is shown. Further highlights
+		within this time, e.g. when an arrow key is held down, replace the pending one.
+	"""
+
 
 	def __init__(self, *args:Any, **kwargs:Any) -> None:
 
 		self.parentContainer = kwargs.pop('parentContainer', None)
 		super().__init__(*args, **kwargs)
+		self._highlightTimer:Optional[Timer] = None
+		self._expandedNodes:set[str] = set()	# resource IDs of nodes to expand again after an update of the tree
 
 	
 	# def on_mount(self) -> None:
@@ -51,29 +97,67 @@ class ACMEResourceTree(TextualTree):
 		self._app = cast(ACMETuiApp, self.app)
 
 
-	def _update_tree(self) -> None:
+	@work(exclusive = True, group = 'tree-build')
+	async def _update_tree(self, rebuild:bool = False) -> None:
+		"""	Update the resource tree.
+
+			If the tree has been built already then only the child nodes of the root and of 
+			expanded nodes whose child resources have changed are updated. This keeps the 
+			expansion state and the cursor position of the tree.
+
+			The update runs as a worker. The child resources are retrieved in a separate thread,
+			so that the UI stays responsive. A new update cancels a running one.
+
+			Args:
+				rebuild: If *True* then the tree is always rebuilt from scratch.
+		"""
 		if not self.visible:
 			return
-		self.clear()
-		self.auto_expand = False
-		self.select_node(None)
-		prevType = ''
-		for resource in self._retrieve_resource_children(RC.cseRi):
-			ty = resource[0].ty
-			if ty != prevType and not ResourceTypes.isVirtualResource(ty):
-				self.root.add(f'[{self._app.objectColor} b]{ResourceTypes.fullname(ty)}[/]', allow_expand = False)
-				prevType = ty
-			self.root.add(resource[0].rn, data = resource[0].ri, allow_expand = resource[1])
-		self._update_content(self.cursor_node.data)
+		if rebuild or not self.root.children:
+			children = await asyncio.to_thread(self._retrieve_resource_children, RC.cseRi)
+			self._cancelHighlightTimer()	# The highlighted node is removed
+			self._expandedNodes.clear()
+			self.clear()
+			self.auto_expand = False
+			self.select_node(None)
+			self._addChildNodes(self.root, RC.cseRi, children)
+			self._update_content(self.cursor_node.data)
+		else:
+			await self._refreshNodeChildren(self.root)
+			self._cancelHighlightTimer()	# The highlighted node may have been removed
+			if (_node := self.cursor_node) is not None:
+				self._showNode(_node)
+			else:
+				self._update_content(RC.cseRi)
 
 
 	def on_tree_node_highlighted(self, node:TextualTree.NodeHighlighted) -> None:
+		# Only show the content of the last highlighted node when the highlight moves quickly
+		self._cancelHighlightTimer()
+		self._highlightTimer = self.set_timer(self.highlightDelay, partial(self._showNode, node.node))
+
+
+	def _cancelHighlightTimer(self) -> None:
+		"""	Stop a pending timer that would show the content of a highlighted node.
+		"""
+		if self._highlightTimer:
+			self._highlightTimer.stop()
+			self._highlightTimer = None
+
+
+	def _showNode(self, node:TreeNode) -> None:
+		"""	Show the content of a tree node in the resource view.
+
+			Args:
+				node: The tree node to show.
+		"""
+		self._highlightTimer = None
 		try:
-			if node.node.data:
-				self._update_content(node.node.data)
+			if node.data:
+				self._update_content(node.data)
 			else:
 				# No data means this is a type section
-				self._update_type_section(str(node.node.label))
+				self._update_type_section(str(node.label))
 		except ResponseException as e:
 			# self.parentContainer.resourceView.update(f'ERROR: {e.dbg}')
 			self.parentContainer.updateResourceView(error = f'ERROR: {e.dbg}')
@@ -133,7 +217,7 @@ class ACMEResourceTree(TextualTree):
 				else:
 					resource = None
 		except ResponseException as e:
-			self._update_tree()
+			self._update_tree(rebuild = True)
 			return
 		
 		# Update the resource view and other views
@@ -145,7 +229,7 @@ class ACMEResourceTree(TextualTree):
 
 		# Set the visibility of the tabs
 		try:
-			self.parentContainer.tabs.show_tab('tree-tab-requests')
+			self.parentContainer.setTabsVisibility(show = ( 'tree-tab-requests', ))
 		except:
 			pass
 
@@ -159,12 +243,12 @@ class ACMEResourceTree(TextualTree):
 		self.parentContainer.setResourceHeader(f'{label} Resources')
 		# self.parentContainer.resourceView.update('')
 		self.parentContainer.updateResourceView()
-		self.parentContainer.tabs.hide_tab('tree-tab-diagram')
-		self.parentContainer.tabs.hide_tab('tree-tab-requests')
-		self.parentContainer.tabs.hide_tab('tree-tab-services')	
-		self.parentContainer.tabs.hide_tab('tree-tab-delete')
-		self.parentContainer.tabs.hide_tab('tree-tab-update')
-		self.parentContainer.tabs.hide_tab('tree-tab-create')
+		self.parentContainer.setTabsVisibility(hide = ( 'tree-tab-diagram', 
+														'tree-tab-requests', 
+														'tree-tab-services', 
+														'tree-tab-delete', 
+														'tree-tab-update', 
+														'tree-tab-create' ))
 
 
 	def _buildNodeChildren(self, node:TreeNode) -> None:
@@ -174,21 +258,90 @@ class ACMEResourceTree(TextualTree):
 			pass # Catch key error that might occur hear. Not much that we can do here
 		#self._app.notify(str([ x.id for x in node.children]))
 		# node._children = []	# no available method?
-		prevType = ''
-		for resource in self._retrieve_resource_children(node.data):
-			ty = resource[0].ty
-			if ty != prevType and not ResourceTypes.isVirtualResource(ty):
-				node.add(f'[{self._app.objectColor} b]{ResourceTypes.fullname(ty)}[/]', allow_expand = False)
-				prevType = ty
-			node.add(resource[0].rn, data = resource[0].ri, allow_expand = resource[1])
+		self._addChildNodes(node, node.data)
+		self._expandChildNodes(node)
+		
+		# Child nodes are expandable until they are expanded for the first time. Only then it is known
+		# whether a resource actually has children.
+		node.allow_expand = node.is_root or len(node.children) > 0
 	
 
 
-	def _retrieve_resource_children(self, ri:str) -> List[Tuple[Resource, bool]]:
+	async def _refreshNodeChildren(self, node:TreeNode) -> None:
+		"""	Update the child nodes of a tree node if its child resources have changed,
+			and recursively do the same for the expanded child nodes.
+
+			Child nodes that were expanded before are expanded again after an update.
+
+			Args:
+				node: The tree node to update.
+		"""
+		children = await asyncio.to_thread(self._retrieve_resource_children, node.data)
+		if [ n.data for n in node.children if n.data ] == [ c[0].ri for c in children ]:
+			# Nothing changed on this level. Continue with the expanded child nodes
+			for n in list(node.children):
+				if n.data and n.is_expanded:
+					await self._refreshNodeChildren(n)
+			return
+
+		# Remember all expanded nodes below this node
+		nodes = list(node.children)
+		while nodes:
+			n = nodes.pop()
+			if n.data and n.is_expanded:
+				self._expandedNodes.add(n.data)
+				nodes.extend(n.children)
+
+		try:
+			node.remove_children()
+		except KeyError:
+			pass # Catch key error that might occur hear. Not much that we can do here
+		self._addChildNodes(node, node.data, children)
+		node.allow_expand = node.is_root or len(node.children) > 0
+		self._expandChildNodes(node)
+
+
+	def _expandChildNodes(self, node:TreeNode) -> None:
+		"""	Expand the child nodes of a tree node that were expanded before an update of the tree.
+
+			Expanding a node builds its children, which again expands the children that were 
+			expanded before.
+
+			Args:
+				node: The tree node whose child nodes are expanded.
+		"""
+		if not self._expandedNodes:
+			return
+		for n in node.children:
+			if n.data in self._expandedNodes:
+				self._expandedNodes.discard(n.data)
+				n.expand()
+
+
+	def _addChildNodes(self, node:TreeNode, ri:str, children:Optional[List[Tuple[Resource, bool, Optional[str]]]] = None) -> None:
+		"""	Add the child resources of a resource as nodes to a tree node.
+
+			Args:
+				node: The tree node to add the child nodes to.
+				ri: The resource id of the parent resource.
+				children: Optional, already retrieved result of `_retrieve_resource_children()` for *ri*.
+		"""
+		for resource, mayHaveChildren, section in children if children is not None else self._retrieve_resource_children(ri):
+			if section:
+				node.add(f'[{self._app.objectColor} b]{section}[/]', allow_expand = False)
+			node.add(resource.rn, data = resource.ri, allow_expand = mayHaveChildren)
+
+
+	def _retrieve_resource_children(self, ri:str) -> List[Tuple[Resource, bool, Optional[str]]]:
 		"""	Retrieve the children of a resource and return a sorted list of tuples.
 		
-			Each tuple contains a resource and a boolean indicating if the resource
-			has children itself.
+			Each tuple contains a resource, a boolean indicating if the resource
+			may have children itself, and the name of a type section if the resource
+			is the first of its type in the list. 
+			
+			The boolean is *False* for virtual and instance resources and *True* for 
+			all others. Whether a resource actually has children is only determined 
+			when its node is expanded. Virtual resources don't start a type section.
 
 			Sort order is: virtual and instance resources first, then by type and name.
 			
@@ -196,24 +349,29 @@ class ACMEResourceTree(TextualTree):
 				ri: The resource id of the parent resource.
 				
 			Returns:
-				A sorted list of tuples (resource, hasChildren).
+				A sorted list of tuples (resource, mayHaveChildren, typeSection).
 		"""
-		result:List[Tuple[Resource, bool]] = []
-		chs = [ x for x in CSE.dispatcher.retrieveDirectChildResources(ri) if not x.ty in [ ResourceTypes.GRP_FOPT, ResourceTypes.PCH_PCU ]]
-		
-		# Sort resources: virtual and instance resources first, then by type and name
-		top = []
-		rest = []
-		for resource in chs:
-			if ResourceTypes.isVirtualResource(resource.ty) or ResourceTypes.isInstanceResource(resource.ty):
-				top.append(resource)
-			else:
-				rest.append(resource)
-		rest.sort(key = lambda r: (r.ty, r.rn))
-		chs = top + rest
-
-		for resource in chs:
-			result.append((resource, len([ x for x in CSE.dispatcher.retrieveDirectChildResources(resource.ri)  ]) > 0))
+		isVirtualResource = ResourceTypes.isVirtualResource
+		isInstanceResource = ResourceTypes.isInstanceResource
+
+		# Sort resources: virtual and instance resources first (in their retrieved order), then by type and name.
+		# Virtual and instance resources have no children, all others might have
+		chs:List[Tuple[tuple, Resource]] = []
+		for resource in CSE.dispatcher.retrieveDirectChildResources(ri):
+			if (ty := resource.ty) in _hiddenResourceTypes:
+				continue
+			chs.append(((0,) if isVirtualResource(ty) or isInstanceResource(ty) else (1, ty, resource.rn), resource))
+		chs.sort(key = itemgetter(0))
+
+		result:List[Tuple[Resource, bool, Optional[str]]] = []
+		prevType = None
+		for key, resource in chs:
+			ty = resource.ty
+			section = None
+			if ty != prevType and not isVirtualResource(ty):
+				section = ResourceTypes.fullname(ty)
+				prevType = ty
+			result.append((resource, key[0] == 1, section))
 		return result
 
 
@@ -229,6 +387,9 @@ class ACMEContainerTree(Container):
 				# delete requests
 				]
 
+	renderedResourcesSize = 128
+	"""	Maximum number of rendered resources that are kept for the resource view. """
+
 
 	from ..textui import ACMETuiApp
 
@@ -242,6 +403,8 @@ class ACMEContainerTree(Container):
 
 		
 		self.currentResource:Resource = None
+		self._visibleTabs:dict[str, bool] = {}	# tab pane ID -> visibility, changed by setTabsVisibility()
+		self._renderedResources:ACMELRUCache = ACMELRUCache(maxsize = self.renderedResourcesSize)	# (ri, type, theme) -> (resource dictionary, rendering)
 
 		# Create some views and widgets beforehand
 		self._treeView = ACMEResourceTree(RC.cseRn, data = RC.cseRi, id = 'tree-view', parentContainer = self)
@@ -315,8 +478,10 @@ class ACMEContainerTree(Container):
 				event: The Click event.
 		"""
 
+		_widget = self.screen.get_widget_at(event.screen_x, event.screen_y)[0]
+
 		# When clicking on the container of the resource view
-		if self.screen.get_widget_at(event.screen_x, event.screen_y)[0] is (_cnt := self.resourceContainer):
+		if _widget is (_cnt := self.resourceContainer):
 			
 			# When clicking on the bottom border: Copy the structured or unstructured resource identifier
 			if event.y == _cnt.outer_size.height-1:
@@ -342,7 +507,7 @@ class ACMEContainerTree(Container):
 					self._app.showNotification(v, t, 'information')
 
 		# When clicking on the resource view
-		elif self.screen.get_widget_at(event.screen_x, event.screen_y)[0] is self.resourceView:
+		elif _widget is self.resourceView:
 			if self._app.copyToClipboard(v := json.dumps(self.currentResource.asDict(sort = True), indent = 2)):
 				self._app.showNotification(limitLines(v, 5), 'Resource Copied', 'information')
 
@@ -392,109 +557,96 @@ class ACMEContainerTree(Container):
 			# Update the services view
 			self.servicesView.updateResource(self.currentResource)
 
-			# Update Diagram view
+			# Update Diagram view and set the visibility of the tabs
 			try:
-
-				# Show some default tabs
-				self.tabs.show_tab('tree-tab-services')
-
-				match self.currentResource.ty:
-					case ResourceTypes.CSEBase:
-						# Don't allow to send request to the CSE resource - hide all tabs
-						self.tabs.hide_tab('tree-tab-update')
-						self.tabs.hide_tab('tree-tab-delete')
-						self.tabs.hide_tab('tree-tab-diagram') 
-
-					case ResourceTypes.CNT | ResourceTypes.TS:
-						instances = CSE.dispatcher.retrieveDirectChildResources(self.currentResource.ri, [ResourceTypes.CIN, ResourceTypes.TSI])
-						
-						# The following lines may fail if the content cannot be converted to a float or a boolean.
-						# This is expected! This just means that any content is not a number and we cannot raw a diagram.
-						# The exception is caught below and the diagram view is hidden.
-						try:
-							values = [float(r.con) for r in instances]
-						except ValueError:
-							# Number (int or float) failed. Now try boolean
-							values = []
-							for r in instances:
-								_con = r.con
-								if isinstance(_con, str):
-									if _con.lower() in ['true', 'on', 'yes', 'high']:
-										values.append(1)
-									elif _con.lower() in ['false', 'off', 'no', 'low']:
-										values.append(0)
-									else:
-										self.app.bell()
-										raise ValueError	# not a "boolean" value
-								else:
-									raise ValueError	# Not a string in the first place
-
-						dates = [r.ct for r in instances]
-
-						self.diagram.setData(values, dates)
-						self.diagram.plotGraph()
-						self.tabs.show_tab('tree-tab-diagram')
-						self.tabs.show_tab('tree-tab-create')
-						self.tabs.show_tab('tree-tab-delete')
-						self.tabs.show_tab('tree-tab-update')
-
-					case ResourceTypes.CIN | ResourceTypes.TSI | ResourceTypes.FCI:
-						self.tabs.hide_tab('tree-tab-diagram') 
-						self.tabs.show_tab('tree-tab-create')
-						self.tabs.hide_tab('tree-tab-update')
-						self.tabs.show_tab('tree-tab-delete')
+				if self.currentResource.ty in ( ResourceTypes.CNT, ResourceTypes.TS ):
+					instances = CSE.dispatcher.retrieveDirectChildResources(self.currentResource.ri, [ResourceTypes.CIN, ResourceTypes.TSI])
 					
-					case ResourceTypes.CNT_LA | ResourceTypes.CNT_OL | ResourceTypes.FCNT_LA | ResourceTypes.FCNT_OL | ResourceTypes.TS_OL | ResourceTypes.TS_LA:
-						self.tabs.hide_tab('tree-tab-diagram') 
-						self.tabs.show_tab('tree-tab-create')
-						self.tabs.hide_tab('tree-tab-update')
-						self.tabs.show_tab('tree-tab-delete')
-
-					case _:
-						self.tabs.hide_tab('tree-tab-diagram') 
-						self.tabs.show_tab('tree-tab-create')
-						self.tabs.show_tab('tree-tab-update')
-						self.tabs.show_tab('tree-tab-delete')
+					# The following lines may fail if the content cannot be converted to a float or a boolean.
+					# This is expected! This just means that any content is not a number and we cannot raw a diagram.
+					# The exception is caught below and the diagram view is hidden.
+					try:
+						values = [float(r.con) for r in instances]
+					except ValueError:
+						# Number (int or float) failed. Now try boolean
+						values = []
+						for r in instances:
+							_con = r.con
+							if isinstance(_con, str):
+								if (_con := _con.lower()) in _diagramTrueValues:
+									values.append(1)
+								elif _con in _diagramFalseValues:
+									values.append(0)
+								else:
+									self.app.bell()
+									raise ValueError	# not a "boolean" value
+							else:
+								raise ValueError	# Not a string in the first place
+
+					dates = [r.ct for r in instances]
+
+					self.diagram.setData(values, dates)
+					self.diagram.plotGraph()
+
+				_show, _hide = _tabsVisibility.get(self.currentResource.ty, _tabsVisibilityDefault)
+				self.setTabsVisibility(show = _show, hide = _hide)
 			except:
 				try:
-					self.tabs.hide_tab('tree-tab-diagram')
-					self.tabs.show_tab('tree-tab-update')
-					self.tabs.show_tab('tree-tab-delete')
-					self.tabs.show_tab('tree-tab-create')
+					self.setTabsVisibility(show = ( 'tree-tab-services', 'tree-tab-update', 'tree-tab-delete', 'tree-tab-create' ), hide = ( 'tree-tab-diagram', ))
 				except:
 					pass
 
 		else:
 
 			# Disable the views
-			self.tabs.hide_tab('tree-tab-diagram') 
-			self.tabs.hide_tab('tree-tab-create')
-			self.tabs.hide_tab('tree-tab-update')
-			self.tabs.hide_tab('tree-tab-delete')
-			self.tabs.hide_tab('tree-tab-services')
+			self.setTabsVisibility(hide = ( 'tree-tab-diagram', 'tree-tab-create', 'tree-tab-update', 'tree-tab-delete', 'tree-tab-services' ))
 
 			# Update the requests view with an empty string
 			self._update_requests('')
 			
 		# Add syntax highlighting and add to the view
 		# self.resourceView.update(Syntax(jsns, 'json', theme = self.app.syntaxTheme))	# type: ignore [attr-defined]
-		self.updateResourceView(commentJson(self.currentResource.asDict(sort = True), 
-								explanations = self.app.attributeExplanations,	# type: ignore [attr-defined]
-								getAttributeValueName = lambda a, v: CSE.validator.getAttributeValueName(a, v, self.currentResource.ty if self.currentResource else None)))	# type: ignore [attr-defined]
+		self.resourceView.update(self._renderResource(self.currentResource))
 
 
 	def updateResourceView(self, value:Optional[str|Resource] = None, error:Optional[str] = None) -> None:
 		if value:
 			if isinstance(value, Resource):
-				value = commentJson(value.asDict(sort = True), 
-									explanations = self.app.attributeExplanations,	# type: ignore [attr-defined]
-									getAttributeValueName = lambda a, v: CSE.validator.getAttributeValueName(a, v, value.ty if value else None))	# type: ignore [attr-defined]
-			self.resourceView.update(Syntax(value, 'json', theme = self.app.syntaxTheme))	# type: ignore [attr-defined]
+				self.resourceView.update(self._renderResource(value))
+			else:
+				self.resourceView.update(Syntax(value, 'json', theme = self.app.syntaxTheme))	# type: ignore [attr-defined]
 		elif error:
 			self.resourceView.update(error)
 		else:
 			self.resourceView.update('')
 
+
+	def _renderResource(self, resource:Resource) -> Syntax:
+		"""	Render a resource as commented and highlighted JSON.
+
+			The renderings of the most recently shown resources are kept and returned again 
+			if neither the resource's attributes nor the syntax theme have changed, e.g. when 
+			the same resource is selected again.
+
+			Args:
+				resource: The resource to render.
+
+			Return:
+				The *Syntax* object with the rendered resource.
+		"""
+		_dct = resource.asDict(sort = True)
+		_theme = self.app.syntaxTheme	# type: ignore [attr-defined]
+		_key = (resource.ri, resource.ty, _theme)
+		if (_rendered := self._renderedResources.get(_key)) and _rendered[0] == _dct:
+			return _rendered[1]
+		_syntax = Syntax(commentJson(_dct, 
+									 explanations = self.app.attributeExplanations,	# type: ignore [attr-defined]
+									 getAttributeValueName = lambda a, v: CSE.validator.getAttributeValueName(a, v, resource.ty)),
+						 'json', 
+						 theme = _theme)
+		self._renderedResources[_key] = (_dct, _syntax)
+		return _syntax
+
 	
 	async def on_tabbed_content_tab_activated(self, event:TabbedContent.TabActivated) -> None:
 	#async def on_tabs_tab_activated(self, event:Tabs.TabActivated) -> None:
@@ -545,6 +697,24 @@ class ACMEContainerTree(Container):
 		self.resourceContainer.border_subtitle = subtitle
 	
 
+	def setTabsVisibility(self, show:Sequence[str] = (), hide:Sequence[str] = ()) -> None:
+		"""	Show and hide tabs in one batch. Only tabs whose visibility changes are shown or hidden.
+		
+			Args:
+				show: IDs of the tab panes to show.
+				hide: IDs of the tab panes to hide.
+		"""
+		with self.app.batch_update():
+			for tabID in show:
+				if not self._visibleTabs.get(tabID, True):	# all tabs are visible at the beginning
+					self.tabs.show_tab(tabID)
+					self._visibleTabs[tabID] = True
+			for tabID in hide:
+				if self._visibleTabs.get(tabID, True):
+					self.tabs.hide_tab(tabID)
+					self._visibleTabs[tabID] = False
+
+
 	@property
 	def tabs(self) -> TabbedContent:
 		return self._treeTabs
@@ -296,8 +296,10 @@ class ACMETuiApp(App):
 			BackgroundWorkerPool.runJob(lambda:self.containerTools.scriptVisualBell(scriptName))
 
 	def refreshResources(self) -> None:
-		if self.containerTree:
-			self.containerTree.update()
+		# The tree is updated by a worker, which must be started in the UI's event loop.
+		# This method may be called from another thread, e.g. by a script.
+		if self.containerTree and self.event_loop:
+			self.event_loop.call_soon_threadsafe(self.containerTree.update)
 
 	#########################################################################
 
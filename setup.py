@@ -1,6 +1,6 @@
 from setuptools import setup, find_packages
 
-import pathlib, os, time
+import pathlib, time
 
 # The directory containing this file
 HERE = pathlib.Path(__file__).parent
@@ -8,10 +8,6 @@ HERE = pathlib.Path(__file__).parent
 # The text of the README file
 README = (HERE / 'tools/pypi/README.md').read_text()
 
-# Find directories that are modules and have __init__.py
-directories = [d for d,n,f in os.walk('acmecse') if '__init__.py' in f]
-print(directories)
-
 setup(
 	# name='acmecse-dev',
 	# version=f'2024.dev.{time.strftime("%Y%m%d%H%M%S")}',
@@ -60,7 +56,7 @@ setup(
 	license='BSD',
 	long_description=README,
 	long_description_content_type='text/markdown',
-	packages = directories,
+	packages = find_packages(include = [ 'acmecse', 'acmecse.*' ]),	# modules that have an __init__.py
 	#package_dir={'acmecse': 'acmecse'},
 	url='https://acmecse.net',
 )
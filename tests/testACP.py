@@ -834,6 +834,112 @@ class TestACP(unittest.TestCase):
 		DELETE(grp2URL, ORIGINATOR)
 		DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
 
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_updateDeleteACPCheckAccess(self) -> None:
+		"""	Test that updating and deleting an ACP is applied to the next access"""
+
+		#
+		#	CSEBase                             
+		#    ├─ae                       
+		#    ├─acp                       
+		#    └─cnt                      
+
+		DELETE(aeURL, ORIGINATOR)
+		DELETE(acpURL, ORIGINATOR)
+		dct = 	{ 'm2m:ae' : {
+			'rn': aeRN, 
+			'api': APPID,
+			'rr': False,
+			'srv': [ RELEASEVERSION ],
+		}}
+		TestACP.ae, rsc = CREATE(cseURL, 'C', T.AE, dct)
+		self.assertEqual(rsc, RC.CREATED)
+		TestACP.originator = findXPath(TestACP.ae, 'm2m:ae/aei')
+
+		# ACP that grants the AE RETRIEVE and CREATE
+		dct = 	{ 'm2m:acp': {
+					'rn': acpRN,
+					'pv': {
+						'acr': [ {
+							'acor': [ TestACP.originator ],
+							'acop': Permission.RETRIEVE + Permission.CREATE,
+						}]
+					},
+					'pvs': { 
+						'acr': [ {
+							'acor': [ ORIGINATOR ],
+							'acop': Permission.ALL
+						} ]
+					},
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.ACP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		acpRi = findXPath(r, 'm2m:acp/ri')
+
+		# CNT with acpi to the ACP
+		dct = 	{ 'm2m:cnt': {
+					'rn': cntRN,
+					'acpi': [ acpRi ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# Retrieve the CNT with the AE -> OK
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', TestACP.originator)
+		self.assertEqual(rsc, RC.OK, r)
+
+		# Update the ACP to grant access to another originator only
+		dct = 	{ 'm2m:acp': {
+					'pv': {
+						'acr': [ {
+							'acor': [ TestACP.acpORIGINATOR ],
+							'acop': Permission.RETRIEVE + Permission.CREATE,
+						}]
+					},
+				}}
+		r, rsc = UPDATE(acpURL, ORIGINATOR, dct)
+		self.assertEqual(rsc, RC.UPDATED, r)
+
+		# Retrieve the CNT with the AE -> Fail
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', TestACP.originator)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# Update the ACP to grant the AE RETRIEVE only
+		dct = 	{ 'm2m:acp': {
+					'pv': {
+						'acr': [ {
+							'acor': [ TestACP.originator ],
+							'acop': Permission.RETRIEVE,
+						}]
+					},
+				}}
+		r, rsc = UPDATE(acpURL, ORIGINATOR, dct)
+		self.assertEqual(rsc, RC.UPDATED, r)
+
+		# Retrieve the CNT with the AE -> OK
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', TestACP.originator)
+		self.assertEqual(rsc, RC.OK, r)
+
+		# Create a CIN under the CNT with the AE -> Fail
+		dct = 	{ 'm2m:cin': {
+					'con': 'test'
+				}}
+		r, rsc = CREATE(f'{cseURL}/{cntRN}', TestACP.originator, T.CIN, dct)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# Delete the ACP
+		r, rsc = DELETE(acpURL, ORIGINATOR)
+		self.assertEqual(rsc, RC.DELETED, r)
+
+		# Retrieve the CNT with the AE -> Fail
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', TestACP.originator)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# cleanup
+		DELETE(aeURL, ORIGINATOR)
+		DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
+
 	
 	#
 	#	AccessControlAttributes
@@ -1804,6 +1910,7 @@ def run(testFailFast:bool) -> TestResult:
 
 		# ACP with GRP tests 
 		'test_testACPacorGRP',
+		'test_updateDeleteACPCheckAccess',
 
 		# ACP with accessControlAttributes
 		'test_createACPwithACA',
@@ -10,7 +10,7 @@
 import unittest, sys
 if '..' not in sys.path:
 	sys.path.append('..')
-from acme.etc.Types import ResourceTypes as T, ResponseStatusCode as RC
+from acme.etc.Types import Permission, ResourceTypes as T, ResponseStatusCode as RC
 from init import *
 
 
@@ -489,6 +489,107 @@ class TestGRP(unittest.TestCase):
 		self.assertIsInstance(rsp, list)
 		self.assertEqual(len(rsp), 2)
 
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_updateDeleteGRPinACPacorCheckAccess(self) -> None:
+		""" Update and delete a <GRP> in an <ACP>'s acor and check the next access """
+
+		#
+		#	CSEBase
+		#    ├─ae2
+		#    ├─grp (mid: ae2)
+		#    ├─acp (acor: grp)
+		#    └─cnt (acpi: acp)
+
+		ae2URL = f'{cseURL}/{aeRN}2'
+		grpACPURL = f'{cseURL}/{grpRN}ACP'
+		cntACPURL = f'{cseURL}/{cntRN}ACP'
+		DELETE(ae2URL, ORIGINATOR)
+		DELETE(grpACPURL, ORIGINATOR)
+		DELETE(acpURL, ORIGINATOR)
+		DELETE(cntACPURL, ORIGINATOR)
+
+		dct = 	{ 'm2m:ae' : {
+					'rn'  : f'{aeRN}2', 
+					'api' : APPID,
+				 	'rr'  : False,
+				 	'srv' : [ RELEASEVERSION ]
+				}}
+		r, rsc = CREATE(cseURL, 'C', T.AE, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		ae2Originator = findXPath(r, 'm2m:ae/aei')
+
+		# grp with the second AE as member
+		dct = 	{ 'm2m:grp' : { 
+					'rn' : f'{grpRN}ACP',
+					'mt' : T.MIXED,
+					'mnm': 10,
+					'mid': [ findXPath(r, 'm2m:ae/ri') ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.GRP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		grpRi = findXPath(r, 'm2m:grp/ri')
+
+		# ACP with the grp in acor
+		dct = 	{ 'm2m:acp': {
+					'rn': acpRN,
+					'pv': {
+						'acr': [ {
+							'acor': [ grpRi ],
+							'acop': Permission.RETRIEVE,
+						}]
+					},
+					'pvs': { 
+						'acr': [ {
+							'acor': [ ORIGINATOR ],
+							'acop': Permission.ALL
+						} ]
+					},
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.ACP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# CNT with acpi to the ACP
+		dct = 	{ 'm2m:cnt': {
+					'rn': f'{cntRN}ACP',
+					'acpi': [ findXPath(r, 'm2m:acp/ri') ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# Retrieve the CNT with the group member -> OK
+		r, rsc = RETRIEVE(cntACPURL, ae2Originator)
+		self.assertEqual(rsc, RC.OK, r)
+		r, rsc = RETRIEVE(cntACPURL, TestGRP.originator)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# Replace the grp member with the other AE
+		dct = 	{ 'm2m:grp' : { 
+					'mid': [ TestGRP.originator ]
+				}}
+		r, rsc = UPDATE(grpACPURL, ORIGINATOR, dct)
+		self.assertEqual(rsc, RC.UPDATED, r)
+
+		# Retrieve the CNT with the former group member -> Fail
+		r, rsc = RETRIEVE(cntACPURL, ae2Originator)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+		r, rsc = RETRIEVE(cntACPURL, TestGRP.originator)
+		self.assertEqual(rsc, RC.OK, r)
+
+		# Delete the grp
+		r, rsc = DELETE(grpACPURL, ORIGINATOR)
+		self.assertEqual(rsc, RC.DELETED, r)
+
+		# Retrieve the CNT with the former group member -> Fail
+		r, rsc = RETRIEVE(cntACPURL, TestGRP.originator)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# cleanup
+		DELETE(cntACPURL, ORIGINATOR)
+		DELETE(acpURL, ORIGINATOR)
+		DELETE(ae2URL, ORIGINATOR)
+
+
 #TODO check GRP itself: members
 
 
@@ -532,6 +633,9 @@ def run(testFailFast:bool) -> TestResult:
 		'test_createCNTCNTviaFopt',
 		'test_deleteGRPByAssignedOriginator',
 
+		# Test GRP in ACP acor
+		'test_updateDeleteGRPinACPacorCheckAccess',
+
 	])
 
 	# Run tests
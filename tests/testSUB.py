@@ -1564,6 +1564,60 @@ class TestSUB(unittest.TestCase):
 		self.assertEqual(findXPath(r, 'm2m:sub/nsi/{0}/noec'), 5, r)
 
 
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_updateSUBcountBatchNotificationsWithLn(self) -> None:
+		""" Count batch notifications with latestNotify """
+
+		# Enable latestNotify for the batch notifications, and clear the count
+		dct:JSON =	{ 'm2m:sub' : {
+					'nse': True,
+					'ln': True
+				}}
+		r, rsc = UPDATE(f'{self.aePOAURL}/{subRN}', TestSUB.originatorPoa, dct)	
+		self.assertEqual(rsc, RC.UPDATED, r)
+		self.assertEqual(findXPath(r, 'm2m:sub/bn/num'), numberOfBatchNotifications, r)
+		self.assertTrue(findXPath(r, 'm2m:sub/ln'), r)
+		# nsi must be empty
+		self.assertIsNone(findXPath(r, 'm2m:sub/nsi'), r)
+
+		# Make some Updates and cause a batch notification
+		clearLastNotification()
+		for i in range(numberOfBatchNotifications):
+			dct =	{ 'm2m:ae' : {
+						'lbl' : [ f'test{i}' ]
+					}}
+			r, rsc = UPDATE(f'{self.aePOAURL}', TestSUB.originatorPoa, dct)	
+			self.assertEqual(rsc, RC.UPDATED, r)
+		testSleep(1)	# Just wait a moment to give the CSE some time
+
+		# Only the latest notification is sent
+		lastNotification = getLastNotification(wait = notificationDelay)
+		self.assertIsNotNone(findXPath(lastNotification, 'm2m:agn/m2m:sgn'), lastNotification)
+		self.assertEqual(len(findXPath(lastNotification, 'm2m:agn/m2m:sgn')), 1, lastNotification)
+		self.assertEqual(findXPath(lastNotification, 'm2m:agn/m2m:sgn/{0}/nev/rep/m2m:ae/lbl'), [ f'test{numberOfBatchNotifications-1}' ], lastNotification)
+		lastNotificationHeaders = getLastNotificationHeaders()
+		self.assertEqual(lastNotificationHeaders[C.hfEC], '4') # 'latest'
+
+		# retrieve <sub> to get the stats. All notifications of the batch are counted
+		r, rsc = RETRIEVE(f'{self.aePOAURL}/{subRN}', TestSUB.originatorPoa)	
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertIsNotNone(findXPath(r, 'm2m:sub/nsi'), r)
+		self.assertEqual(findXPath(r, 'm2m:sub/nsi/{0}/rqs'), numberOfBatchNotifications, r)
+		self.assertEqual(findXPath(r, 'm2m:sub/nsi/{0}/rsr'), numberOfBatchNotifications, r)
+
+		# No further notification is sent for the already sent batch
+		clearLastNotification()
+		testSleep(requestCheckDelay)
+		self.assertIsNone(getLastNotification())
+
+		# Disable latestNotify again
+		dct =	{ 'm2m:sub' : {
+					'ln': False
+				}}
+		r, rsc = UPDATE(f'{self.aePOAURL}/{subRN}', TestSUB.originatorPoa, dct)	
+		self.assertEqual(rsc, RC.UPDATED, r)
+
+
 	@unittest.skipIf(noCSE, 'No CSEBase')
 	def test_updateSUBDeleteNSE(self) -> None:
 		""" UPDATE <sub> with deleted nse attribute"""
@@ -2039,6 +2093,7 @@ def run(testFailFast:bool) -> TestResult:
 		'test_updateSUBNSETrue',
 		'test_updateSUBNSETrueAgain',
 		'test_updateSUBcountBatchNotifications',
+		'test_updateSUBcountBatchNotificationsWithLn',
 		'test_updateSUBDeleteNSE',
 
 		# Test operationMonitor